@@ -8,7 +8,108 @@ import pygame
 import sys
 import os
 import subprocess
-from typing import Dict, List
+import multiprocessing
+import runpy
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+@dataclass(frozen=True, slots=True)
+class MenuItem:
+    """One visualization card; grid_index is its position within its category's row"""
+    title: str
+    subtitle: str
+    description: str
+    features: Tuple[str, ...]
+    script: str
+    category: str
+    grid_index: int = 0
+
+# Fonts seen by wrap_text, by id; holding them keeps an id from being reused
+# by a new font while its wrapped lines are still cached
+_wrap_fonts: Dict[int, pygame.font.Font] = {}
+
+@lru_cache(maxsize=512)
+def _wrap_text_cached(text: str, font_id: int, max_width: int) -> Tuple[str, ...]:
+    """Wrap text at spaces to fit within max_width using the registered font with this id
+    
+    Each line's word count is first estimated from the text's average character
+    width, then corrected one word at a time near the edge, so font.size is
+    called about twice per line instead of once per word.
+    """
+    font = _wrap_fonts[font_id]
+    words = text.split(' ')
+    avg_width = (font.size(text)[0] / len(text) if text else 0) or 1.0
+    
+    def fits(start: int, count: int) -> bool:
+        return font.size(' '.join(words[start:start + count]) + ' ')[0] <= max_width
+    
+    lines = []
+    start = 0
+    fresh = True  # at the start of the text or right after a forced word
+    while start < len(words):
+        # Estimate how many words fit from their character counts
+        count, chars = 0, 0
+        while start + count < len(words) and chars + len(words[start + count]) + 1 <= max_width / avg_width:
+            chars += len(words[start + count]) + 1
+            count += 1
+        count = max(count, 1)
+        
+        if fits(start, count):
+            # Extend while the next word still fits
+            while start + count < len(words) and fits(start, count + 1):
+                count += 1
+        else:
+            # Retract until the line fits
+            count -= 1
+            while count > 0 and not fits(start, count):
+                count -= 1
+        
+        if count == 0 and fresh:
+            # Single word is too long, force it anyway
+            lines.append(words[start])
+            start += 1
+            continue
+        
+        # A word too long to fit after a line break still gets a line of its own
+        count = max(count, 1)
+        lines.append(' '.join(words[start:start + count]).strip())
+        start += count
+        fresh = False
+    
+    return tuple(lines)
+
+# Modules every visualization imports; the forkserver loads them once so each
+# launch forks a warm interpreter instead of starting and importing from scratch
+_LAUNCH_PRELOAD = ['numpy', 'pandas', 'pygame', 'PIL.Image']
+
+def _run_script(full_path: str, project_root: str):
+    """Run a visualization script as __main__, as `python full_path` from project_root would"""
+    os.chdir(project_root)
+    sys.path.insert(0, os.path.dirname(full_path))
+    sys.argv = [full_path]
+    runpy.run_path(full_path, run_name='__main__')
+
+def _exit_code(process) -> Optional[int]:
+    """Exit code of a launched Popen or multiprocessing.Process, or None while it runs"""
+    if isinstance(process, subprocess.Popen):
+        return process.poll()
+    return process.exitcode
+
+def _stop_child(process, timeout: float = 2.0):
+    """Terminate a launched Popen or multiprocessing.Process, killing it if it does not exit in time"""
+    process.terminate()
+    if isinstance(process, subprocess.Popen):
+        try:
+            process.wait(timeout)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+    else:
+        process.join(timeout)
+        if process.exitcode is None:
+            process.kill()
+            process.join()
 
 class TimePixelMainMenu:
     """Enhanced main menu system for Time's Pixel visualizations"""
@@ -18,7 +119,9 @@ class TimePixelMainMenu:
         
         self.width = width
         self.height = height
-        self.screen = pygame.display.set_mode((width, height))
+        # SCALED draws through an SDL renderer texture, so the GPU handles presenting
+        # (and any window scaling) while the menu keeps drawing at its logical size
+        self.screen = pygame.display.set_mode((width, height), pygame.SCALED | pygame.DOUBLEBUF)
         pygame.display.set_caption("Time's Pixel - Enhanced Visualization Menu")
         
         # Scrolling variables
@@ -59,7 +162,7 @@ class TimePixelMainMenu:
             self.font_small = pygame.font.SysFont('Arial', 18)
         
         # Menu items configuration
-        self.menu_items = [
+        menu_config = [
             # Interactive Visualizations
             {
                 'title': 'Timelapse Animation',
@@ -112,22 +215,92 @@ class TimePixelMainMenu:
             }
         ]
         
+        # Immutable items, each knowing its column within its category's row
+        self.menu_items: List[MenuItem] = []
+        row_counts: Dict[str, int] = {}
+        for config in menu_config:
+            grid_index = row_counts.get(config['category'], 0)
+            row_counts[config['category']] = grid_index + 1
+            self.menu_items.append(MenuItem(**{**config, 'features': tuple(config['features'])},
+                                            grid_index=grid_index))
+        
         # Group items by category
-        self.interactive_items = [item for item in self.menu_items if item.get('category') == 'interactive']
-        self.static_items = [item for item in self.menu_items if item.get('category') == 'static']
+        self.interactive_items = [item for item in self.menu_items if item.category == 'interactive']
+        self.static_items = [item for item in self.menu_items if item.category == 'static']
+        
+        # Menu indices of each category row's cards, in column order
+        self.row_indices = {
+            category: [i for i, item in enumerate(self.menu_items) if item.category == category]
+            for category in ('interactive', 'static')
+        }
         
         # Calculate layout positions
         self.calculate_layout()
         
+        # Rendered text surfaces keyed by (font id, text, color), shared by
+        # every prerender that draws the same label
+        self._text_surfaces: Dict[Tuple[int, str, Tuple[int, int, int]], pygame.Surface] = {}
+        
+        # Card text never changes, so it is wrapped and rendered once
+        self.card_cache: Dict[int, Dict[str, List[Tuple[pygame.Surface, int, int]]]] = {}
+        self._prerender_cards()
+        
+        # Same for the header, footer and category labels
+        self._static_surfaces: Dict[str, List[Tuple[pygame.Surface, pygame.Rect]]] = {}
+        self._prerender_static_text()
+        
+        # Background with the fixed header and footer, composed once
+        self._chrome = self._build_chrome()
+        
+        # Rounded card and button backgrounds keyed by (category, hovered)
+        self._card_bg_surfaces: Dict[Tuple[str, bool], pygame.Surface] = {}
+        self._button_surfaces: Dict[Tuple[str, bool], pygame.Surface] = {}
+        self._prerender_card_backgrounds()
+        
+        # Whole cards, text included and alpha premultiplied, keyed by
+        # (index, card hovered, button hovered)
+        self._composed_cards: Dict[Tuple[int, bool, bool], pygame.Surface] = {}
+        self._compose_cards()
+        
         # State
         self.selected_item = 0
         self.mouse_pos = (0, 0)
         self.clock = pygame.time.Clock()
         self.running = True
         
+        # The menu is static between events, so it is only redrawn when dirty;
+        # hover_state is the (card, button) under the mouse as last drawn
+        self.dirty = True
+        self.hover_state = (-1, -1)
+        # Set when the whole window must be presented, e.g. after it was exposed
+        self.full_update = True
+        
+        # Scroll keys in units of scroll_speed
+        self._scroll_keys = {pygame.K_UP: -1, pygame.K_DOWN: 1, pygame.K_PAGEUP: -3, pygame.K_PAGEDOWN: 3}
+        
+        # Number keys 1-6 launch the matching card
+        self._hotkey_map = {key: i for i, key in enumerate(
+            (pygame.K_1, pygame.K_2, pygame.K_3, pygame.K_4, pygame.K_5, pygame.K_6))}
+        
         # Get project root for script execution
         self.project_root = os.path.dirname(os.path.abspath(__file__))
         
+        # Running visualizations as (script path, process), reaped in update()
+        self._children: List[Tuple[str, object]] = []
+        
+        # Start the preloading forkserver now so it is warm by the first launch;
+        # without forkserver support (e.g. Windows) scripts run in a fresh interpreter
+        self._launch_context = None
+        if 'forkserver' in multiprocessing.get_all_start_methods():
+            try:
+                self._launch_context = multiprocessing.get_context('forkserver')
+                self._launch_context.set_forkserver_preload(_LAUNCH_PRELOAD)
+                from multiprocessing import forkserver
+                forkserver.ensure_running()
+            except Exception as e:
+                print(f"Falling back to subprocess launches: {e}")
+                self._launch_context = None
+        
         # Calculate maximum scroll distance
         self.calculate_max_scroll()
     
@@ -159,6 +332,25 @@ class TimePixelMainMenu:
             # Multi-row layout (if needed in future)
             self.static_start_x = self.card_margin
             self.static_y = self.interactive_y + self.card_height + 60
+        
+        # Unscrolled top-left of each category row
+        self.row_origins = {
+            'interactive': (self.interactive_start_x, self.interactive_y),
+            'static': (self.static_start_x, self.static_y),
+        }
+        
+        # Unscrolled top-left of every card and launch button, by menu index
+        pitch = self.card_width + self.card_margin
+        self.button_size = (160, 32)
+        button_dx = (self.card_width - self.button_size[0]) // 2
+        button_dy = self.card_height - 45
+        self._base_card_xy: List[Tuple[int, int]] = []
+        self._base_button_xy: List[Tuple[int, int]] = []
+        for item in self.menu_items:
+            row_x, row_y = self.row_origins[item.category]
+            x = row_x + item.grid_index * pitch
+            self._base_card_xy.append((x, row_y))
+            self._base_button_xy.append((x + button_dx, row_y + button_dy))
     
     def calculate_max_scroll(self):
         """Calculate the maximum scroll distance needed"""
@@ -170,58 +362,225 @@ class TimePixelMainMenu:
         """Keep scroll within valid bounds"""
         self.scroll_y = max(0, min(self.scroll_y, self.max_scroll))
     
+    def scroll_by(self, delta: int):
+        """Scroll by delta pixels within bounds, marking the menu dirty only if the view moved"""
+        previous = self.scroll_y
+        self.scroll_y += delta
+        self.clamp_scroll()
+        if self.scroll_y != previous:
+            self.dirty = True
+    
     def wrap_text(self, text: str, font: pygame.font.Font, max_width: int) -> List[str]:
-        """Wrap text to fit within specified width"""
-        words = text.split(' ')
-        lines = []
-        current_line = ""
-        
-        for word in words:
-            test_line = current_line + word + " " if current_line else word + " "
-            if font.size(test_line)[0] <= max_width:
-                current_line = test_line
+        """Wrap text to fit within specified width, memoized per (text, font, width)"""
+        # Font objects are not hashable in every pygame version, so key by id
+        _wrap_fonts[id(font)] = font
+        return list(_wrap_text_cached(text, id(font), max_width))
+    
+    def render_text(self, font: pygame.font.Font, text: str, color: Tuple[int, int, int]) -> pygame.Surface:
+        """Render antialiased text converted to the display's pixel format for fast blits
+        
+        Surfaces are shared between callers and must not be drawn on.
+        """
+        key = (id(font), text, tuple(color))
+        surface = self._text_surfaces.get(key)
+        if surface is None:
+            surface = font.render(text, True, color).convert_alpha()
+            self._text_surfaces[key] = surface
+        return surface
+    
+    def _prerender_cards(self):
+        """Render every card's text once into self.card_cache.
+        
+        Each entry maps 'title', 'subtitle', 'desc', 'features' and 'button' to
+        (surface, dx, dy) tuples with offsets from the card's top-left corner;
+        the button text is centered on the button at draw time instead.
+        """
+        content_width = self.card_width - 30
+        
+        for index, item in enumerate(self.menu_items):
+            # Category-specific text colors (hover only changes the card and button fills)
+            if item.category == 'interactive':
+                text_color = (220, 240, 255)
+                subtitle_color = (120, 170, 255)
             else:
-                if current_line:
-                    lines.append(current_line.strip())
-                    current_line = word + " "
-                else:
-                    # Single word is too long, force it anyway
-                    lines.append(word)
-                    current_line = ""
+                text_color = (240, 220, 255)
+                subtitle_color = (200, 150, 200)
+            
+            cache = {'title': [], 'subtitle': [], 'desc': [], 'features': [], 'button': []}
+            current_y = 15
+            
+            # Title (ensure it fits)
+            for line in self.wrap_text(item.title, self.font_subtitle, content_width)[:1]:
+                cache['title'].append((self.render_text(self.font_subtitle, line, text_color), 15, current_y))
+                current_y += 32
+            
+            # Subtitle
+            for line in self.wrap_text(item.subtitle, self.font_body, content_width)[:1]:
+                cache['subtitle'].append((self.render_text(self.font_body, line, subtitle_color), 15, current_y))
+                current_y += 26
+            
+            # Description (wrapped, limited lines)
+            desc_text = item.description.replace('\\n', ' ')
+            for line in self.wrap_text(desc_text, self.font_small, content_width)[:3]:
+                desc_surface = self.render_text(self.font_small, line, self.colors['text_secondary'])
+                cache['desc'].append((desc_surface, 15, current_y))
+                current_y += 18
+            
+            current_y += 8
+            
+            # Features (limited to fit in card)
+            max_features = 2
+            for feature in item.features[:max_features]:
+                wrapped_feature = self.wrap_text(f"• {feature}", self.font_small, content_width - 10)
+                for line in wrapped_feature[:1]:
+                    feature_text = self.render_text(self.font_small, line, self.colors['text_secondary'])
+                    cache['features'].append((feature_text, 20, current_y))
+                    current_y += 16
+            
+            # Launch button label, the same in both hover states
+            button_text_content = "Launch" if item.category == 'interactive' else "View"
+            cache['button'].append((self.render_text(self.font_body, button_text_content, (255, 255, 255)), 0, 0))
+            
+            self.card_cache[index] = cache
+    
+    def _prerender_static_text(self):
+        """Render the header, footer and category labels once into self._static_surfaces
+        
+        Header and footer rects are final screen positions; category label rects
+        are positioned for scroll_y = 0 and shifted when drawn.
+        """
+        def render(font, text, color, center):
+            surface = self.render_text(font, text, color)
+            return surface, surface.get_rect(center=center)
+        
+        # Header: main title and subtitle
+        self._static_surfaces['header'] = [
+            render(self.font_title, "Time's Pixel", self.colors['text_primary'], (self.width // 2, 35)),
+            render(self.font_body, "Enhanced Visualization Suite", self.colors['accent'], (self.width // 2, 70)),
+        ]
         
-        if current_line:
-            lines.append(current_line.strip())
+        # Category headers
+        self._static_surfaces['interactive_header'] = [
+            render(self.font_subtitle, "Interactive Visualizations", self.colors['accent'],
+                   (self.width // 2, self.interactive_y - 40))
+        ]
+        self._static_surfaces['static_header'] = [
+            render(self.font_subtitle, "Static Image Gallery", self.colors['accent'],
+                   (self.width // 2, self.static_y - 40))
+        ]
         
-        return lines
+        # Footer instructions
+        footer_y = self.height - 80
+        instructions = [
+            "Scroll: Mouse wheel/arrows • Click: Launch • 1-6: Quick access • ESC: Exit",
+            "Tip: Try Timelapse Animation first!"
+        ]
+        self._static_surfaces['footer'] = []
+        for i, instruction in enumerate(instructions):
+            color = self.colors['accent'] if i == 1 else self.colors['text_secondary']
+            font = self.font_body if i == 1 else self.font_small
+            self._static_surfaces['footer'].append(
+                render(font, instruction, color, (self.width // 2, footer_y + i * 25))
+            )
+        
+        # Scrolled content is clipped to the band between the header and footer text
+        top = max(rect.bottom for _, rect in self._static_surfaces['header'])
+        bottom = min(rect.top for _, rect in self._static_surfaces['footer'])
+        self.scroll_area = pygame.Rect(0, top, self.width, bottom - top)
+        
+        # Everything a redraw can change: the scrolled content and the scroll bar
+        scroll_bar = pygame.Rect(self.width - 20, self.header_height, 15,
+                                 self.height - self.header_height - self.footer_height)
+        self.update_area = self.scroll_area.union(scroll_bar)
+    
+    def _build_chrome(self) -> pygame.Surface:
+        """Compose the background, header and footer, which never move, into one opaque surface"""
+        chrome = pygame.Surface((self.width, self.height)).convert()
+        chrome.fill(self.colors['background'])
+        for surface, rect in self._static_surfaces['header'] + self._static_surfaces['footer']:
+            chrome.blit(surface, rect)
+        return chrome
+    
+    def _prerender_card_backgrounds(self):
+        """Draw each category's card and launch button backgrounds, plain and hovered, once
+        
+        Corners outside the rounded rects stay transparent, so blitting a
+        surface matches drawing the rects straight onto the screen.
+        """
+        # Category-specific colors as (plain, hovered)
+        styles = {
+            'interactive': {
+                'card': ((40, 50, 80), (60, 80, 120)),
+                'border': ((80, 100, 140), (100, 150, 200)),
+                'button': ((60, 120, 180), (80, 150, 200)),
+            },
+            'static': {
+                'card': ((60, 40, 70), (80, 60, 100)),
+                'border': ((100, 80, 120), (150, 100, 180)),
+                'button': ((120, 60, 120), (150, 80, 150)),
+            },
+        }
+        button_size = self.button_size
+        
+        for category, style in styles.items():
+            for hovered in (False, True):
+                card = pygame.Surface((self.card_width, self.card_height), pygame.SRCALPHA).convert_alpha()
+                card.fill((0, 0, 0, 0))
+                card_rect = card.get_rect()
+                pygame.draw.rect(card, style['card'][hovered], card_rect, border_radius=12)
+                pygame.draw.rect(card, style['border'][hovered], card_rect, width=2, border_radius=12)
+                self._card_bg_surfaces[(category, hovered)] = card
+                
+                button = pygame.Surface(button_size, pygame.SRCALPHA).convert_alpha()
+                button.fill((0, 0, 0, 0))
+                pygame.draw.rect(button, style['button'][hovered], button.get_rect(), border_radius=8)
+                self._button_surfaces[(category, hovered)] = button
+    
+    def _compose_cards(self):
+        """Flatten each card's background, text and launch button into one surface per hover state"""
+        for index, item in enumerate(self.menu_items):
+            category = 'interactive' if item.category == 'interactive' else 'static'
+            cache = self.card_cache[index]
+            # Button position relative to the card, which scrolling does not change
+            card_rect = self.get_card_rect(index)
+            button_rect = self.get_launch_button_rect(index).move(-card_rect.x, -card_rect.y)
+            button_text = cache['button'][0][0]
+            
+            for card_hovered in (False, True):
+                for button_hovered in (False, True):
+                    card = self._card_bg_surfaces[(category, card_hovered)].copy()
+                    for key in ('title', 'subtitle', 'desc', 'features'):
+                        for surface, dx, dy in cache[key]:
+                            card.blit(surface, (dx, dy))
+                    card.blit(self._button_surfaces[(category, button_hovered)], button_rect)
+                    card.blit(button_text, button_text.get_rect(center=button_rect.center))
+                    # Premultiplied once here so each draw is a single multiply-add blend
+                    self._composed_cards[(index, card_hovered, button_hovered)] = card.premul_alpha()
     
     def get_card_rect(self, item_index: int) -> pygame.Rect:
         """Get the rectangle for a menu card based on category with scroll support"""
-        item = self.menu_items[item_index]
-        
-        if item.get('category') == 'interactive':
-            # Find position in interactive items
-            interactive_index = next(i for i, it in enumerate(self.interactive_items) if it == item)
-            x = self.interactive_start_x + interactive_index * (self.card_width + self.card_margin)
-            y = self.interactive_y - self.scroll_y
-        else:  # static items
-            # Find position in static items
-            static_index = next(i for i, it in enumerate(self.static_items) if it == item)
-            x = self.static_start_x + static_index * (self.card_width + self.card_margin)
-            y = self.static_y - self.scroll_y
-            
-        return pygame.Rect(x, y, self.card_width, self.card_height)
+        x, y = self._base_card_xy[item_index]
+        return pygame.Rect(x, y - self.scroll_y, self.card_width, self.card_height)
     
     def get_launch_button_rect(self, item_index: int) -> pygame.Rect:
         """Get the rectangle for a launch button"""
-        card_rect = self.get_card_rect(item_index)
-        button_width = 160
-        button_height = 32
-        x = card_rect.x + (self.card_width - button_width) // 2
-        y = card_rect.bottom - 45
-        return pygame.Rect(x, y, button_width, button_height)
+        x, y = self._base_button_xy[item_index]
+        return pygame.Rect(x, y - self.scroll_y, *self.button_size)
+    
+    def _over_button(self, index: int, pos) -> bool:
+        """Whether pos lies on the launch button of card index, without building its rect"""
+        x, y = self._base_button_xy[index]
+        y -= self.scroll_y
+        return x <= pos[0] < x + self.button_size[0] and y <= pos[1] < y + self.button_size[1]
     
     def launch_visualization(self, script_path: str):
-        """Launch a visualization script"""
+        """Launch a visualization script, unless it is still running from an earlier launch"""
+        # Repeated clicks or key presses while a visualization starts up would
+        # otherwise open it several times
+        if any(path == script_path and _exit_code(process) is None for path, process in self._children):
+            print(f"Already running: {script_path}")
+            return
+        
         try:
             full_path = os.path.join(self.project_root, script_path)
             print(f"Launching: {script_path}")
@@ -229,183 +588,140 @@ class TimePixelMainMenu:
             print(f"Script: {full_path}")
             
             if os.path.exists(full_path):
-                result = subprocess.run([sys.executable, full_path], 
-                                      cwd=self.project_root,
-                                      capture_output=False)
-                print(f"Visualization completed with code: {result.returncode}")
+                # Run alongside the menu so it keeps handling events meanwhile
+                if self._launch_context is not None:
+                    process = self._launch_context.Process(target=_run_script,
+                                                           args=(full_path, self.project_root))
+                    process.start()
+                else:
+                    process = subprocess.Popen([sys.executable, full_path], cwd=self.project_root)
+                self._children.append((script_path, process))
             else:
                 print(f"Script not found: {full_path}")
                 
         except Exception as e:
             print(f"Error launching visualization: {e}")
     
+    def _hit_test(self, pos) -> Optional[int]:
+        """Get the index of the menu card under pos, or None
+        
+        Each category is one row of evenly spaced cards, so the row comes from
+        the y range and the column from the card pitch, with no rect per card.
+        """
+        x, y = pos
+        # Runs on every mouse motion, so layout values are read into locals once
+        card_width, card_height, scroll_y = self.card_width, self.card_height, self.scroll_y
+        pitch = card_width + self.card_margin
+        for category, (start_x, row_y) in self.row_origins.items():
+            top = row_y - scroll_y
+            if not top <= y < top + card_height:
+                continue
+            col, offset = divmod(x - start_x, pitch)
+            indices = self.row_indices[category]
+            if 0 <= col < len(indices) and offset < card_width:
+                return indices[col]
+        return None
+    
     def handle_mouse_click(self, pos):
         """Handle mouse clicks on buttons"""
-        for i, item in enumerate(self.menu_items):
-            button_rect = self.get_launch_button_rect(i)
-            if button_rect.collidepoint(pos):
-                self.launch_visualization(item['script'])
-                break
+        index = self._hit_test(pos)
+        if index is not None and self._over_button(index, pos):
+            self.launch_visualization(self.menu_items[index].script)
     
-    def handle_events(self):
-        """Handle pygame events with scroll support"""
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                self.running = False
-            
-            elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    self.running = False
-                elif event.key == pygame.K_UP:
-                    self.scroll_y -= self.scroll_speed
-                    self.clamp_scroll()
-                elif event.key == pygame.K_DOWN:
-                    self.scroll_y += self.scroll_speed
-                    self.clamp_scroll()
-                elif event.key == pygame.K_PAGEUP:
-                    self.scroll_y -= self.scroll_speed * 3
-                    self.clamp_scroll()
-                elif event.key == pygame.K_PAGEDOWN:
-                    self.scroll_y += self.scroll_speed * 3
-                    self.clamp_scroll()
-                elif event.key == pygame.K_HOME:
-                    self.scroll_y = 0
-                elif event.key == pygame.K_END:
-                    self.scroll_y = self.max_scroll
-                elif event.key == pygame.K_1 and len(self.menu_items) > 0:
-                    self.launch_visualization(self.menu_items[0]['script'])
-                elif event.key == pygame.K_2 and len(self.menu_items) > 1:
-                    self.launch_visualization(self.menu_items[1]['script'])
-                elif event.key == pygame.K_3 and len(self.menu_items) > 2:
-                    self.launch_visualization(self.menu_items[2]['script'])
-                elif event.key == pygame.K_4 and len(self.menu_items) > 3:
-                    self.launch_visualization(self.menu_items[3]['script'])
-                elif event.key == pygame.K_5 and len(self.menu_items) > 4:
-                    self.launch_visualization(self.menu_items[4]['script'])
-                elif event.key == pygame.K_6 and len(self.menu_items) > 5:
-                    self.launch_visualization(self.menu_items[5]['script'])
-            
-            elif event.type == pygame.MOUSEBUTTONDOWN:
-                if event.button == 1:  # Left click
-                    self.handle_mouse_click(event.pos)
-                elif event.button == 4:  # Mouse wheel up
-                    self.scroll_y -= self.scroll_speed
-                    self.clamp_scroll()
-                elif event.button == 5:  # Mouse wheel down
-                    self.scroll_y += self.scroll_speed
-                    self.clamp_scroll()
-            
-            elif event.type == pygame.MOUSEMOTION:
-                self.mouse_pos = event.pos
+    def get_hover_state(self) -> Tuple[int, int]:
+        """Get the indices of the card and launch button under the mouse (-1 for none)"""
+        index = self._hit_test(self.mouse_pos)
+        if index is None:
+            return -1, -1
+        # Buttons sit inside their card
+        if self._over_button(index, self.mouse_pos):
+            return index, index
+        return index, -1
+    
+    def handle_events(self, events: List[pygame.event.Event] = None):
+        """Handle a batch of pygame events (by default everything queued)
+        
+        Only the last mouse motion matters and wheel clicks add up to one
+        scroll, so bursts of either cost one hover check or one scroll.
+        """
+        if events is None:
+            events = pygame.event.get()
+        
+        last_motion = None
+        wheel_steps = 0
+        for event in events:
+            if event.type == pygame.MOUSEMOTION:
+                last_motion = event
+            elif event.type == pygame.MOUSEBUTTONDOWN and event.button in (4, 5):
+                wheel_steps += -1 if event.button == 4 else 1
+            else:
+                self.handle_event(event)
+        
+        if wheel_steps:
+            self.scroll_by(wheel_steps * self.scroll_speed)
+        if last_motion is not None:
+            self.handle_event(last_motion)
     
-    def draw_header(self):
-        """Draw the header with improved styling"""
-        # Main title
-        title_text = self.font_title.render("Time's Pixel", True, self.colors['text_primary'])
-        title_rect = title_text.get_rect(center=(self.width // 2, 35))
-        self.screen.blit(title_text, title_rect)
-        
-        # Subtitle with better spacing
-        subtitle_text = self.font_body.render("Enhanced Visualization Suite", True, self.colors['accent'])
-        subtitle_rect = subtitle_text.get_rect(center=(self.width // 2, 70))
-        self.screen.blit(subtitle_text, subtitle_rect)
+    def handle_event(self, event: pygame.event.Event):
+        """Handle one pygame event with scroll support, marking the menu dirty if it changed"""
+        if event.type == pygame.NOEVENT:
+            return
+        
+        if event.type == pygame.MOUSEMOTION:
+            # Moving within the same card and button changes nothing on screen
+            self.mouse_pos = event.pos
+            if self.get_hover_state() != self.hover_state:
+                self.dirty = True
+            return
+        
+        # Scrolling past either end changes nothing, so it redraws only on movement
+        if event.type == pygame.KEYDOWN:
+            if event.key in self._scroll_keys:
+                self.scroll_by(self._scroll_keys[event.key] * self.scroll_speed)
+                return
+            if event.key == pygame.K_HOME:
+                self.scroll_by(-self.scroll_y)
+                return
+            if event.key == pygame.K_END:
+                self.scroll_by(self.max_scroll - self.scroll_y)
+                return
+        if event.type == pygame.MOUSEBUTTONDOWN and event.button in (4, 5):
+            self.scroll_by(-self.scroll_speed if event.button == 4 else self.scroll_speed)
+            return
+        
+        # Keys, clicks and window events can all change the view
+        self.dirty = True
+        if event.type in (pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE, pygame.WINDOWRESTORED):
+            self.full_update = True
+        
+        if event.type == pygame.QUIT:
+            self.running = False
+        
+        elif event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_ESCAPE:
+                self.running = False
+            elif event.key in self._hotkey_map:
+                index = self._hotkey_map[event.key]
+                if index < len(self.menu_items):
+                    self.launch_visualization(self.menu_items[index].script)
+        
+        elif event.type == pygame.MOUSEBUTTONDOWN:
+            if event.button == 1:  # Left click
+                self.handle_mouse_click(event.pos)
     
     def draw_categories(self):
         """Draw category headers"""
         # Interactive category header
         interactive_y = self.interactive_y - 40 - self.scroll_y
         if interactive_y > -30 and interactive_y < self.height:
-            interactive_text = self.font_subtitle.render("Interactive Visualizations", True, self.colors['accent'])
-            interactive_rect = interactive_text.get_rect(center=(self.width // 2, interactive_y))
-            self.screen.blit(interactive_text, interactive_rect)
+            for surface, rect in self._static_surfaces['interactive_header']:
+                self.screen.blit(surface, rect.move(0, -self.scroll_y))
         
         # Static category header  
         static_y = self.static_y - 40 - self.scroll_y
         if static_y > -30 and static_y < self.height:
-            static_text = self.font_subtitle.render("Static Image Gallery", True, self.colors['accent'])
-            static_rect = static_text.get_rect(center=(self.width // 2, static_y))
-            self.screen.blit(static_text, static_rect)
-    
-    def draw_card(self, index: int, item: Dict):
-        """Draw a menu card with proper text wrapping and boundary checking"""
-        card_rect = self.get_card_rect(index)
-        button_rect = self.get_launch_button_rect(index)
-        
-        # Skip drawing if card is completely outside visible area
-        if card_rect.bottom < -50 or card_rect.top > self.height + 50:
-            return
-        
-        # Check if mouse is over card or button
-        mouse_over_card = card_rect.collidepoint(self.mouse_pos)
-        mouse_over_button = button_rect.collidepoint(self.mouse_pos)
-        
-        # Determine category for styling
-        is_interactive = item.get('category') == 'interactive'
-        
-        # Category-specific colors
-        if is_interactive:
-            card_color = (60, 80, 120) if mouse_over_card else (40, 50, 80)
-            border_color = (100, 150, 200) if mouse_over_card else (80, 100, 140)
-            button_color = (80, 150, 200) if mouse_over_button else (60, 120, 180)
-            text_color = (220, 240, 255)
-            subtitle_color = (120, 170, 255)
-        else:
-            card_color = (80, 60, 100) if mouse_over_card else (60, 40, 70)
-            border_color = (150, 100, 180) if mouse_over_card else (100, 80, 120)
-            button_color = (150, 80, 150) if mouse_over_button else (120, 60, 120)
-            text_color = (240, 220, 255)
-            subtitle_color = (200, 150, 200)
-        
-        # Draw card background
-        pygame.draw.rect(self.screen, card_color, card_rect, border_radius=12)
-        pygame.draw.rect(self.screen, border_color, card_rect, width=2, border_radius=12)
-        
-        # Content positioning with proper margins
-        content_x = card_rect.x + 15
-        content_width = self.card_width - 30
-        current_y = card_rect.y + 15
-        
-        # Title (ensure it fits)
-        title_lines = self.wrap_text(item['title'], self.font_subtitle, content_width)
-        for line in title_lines[:1]:
-            title_text = self.font_subtitle.render(line, True, text_color)
-            self.screen.blit(title_text, (content_x, current_y))
-            current_y += 32
-        
-        # Subtitle
-        subtitle_lines = self.wrap_text(item['subtitle'], self.font_body, content_width)
-        for line in subtitle_lines[:1]:
-            subtitle_text = self.font_body.render(line, True, subtitle_color)
-            self.screen.blit(subtitle_text, (content_x, current_y))
-            current_y += 26
-        
-        # Description (wrapped, limited lines)
-        desc_text = item['description'].replace('\\n', ' ')
-        wrapped_desc = self.wrap_text(desc_text, self.font_small, content_width)
-        
-        for line in wrapped_desc[:3]:
-            desc_surface = self.font_small.render(line, True, self.colors['text_secondary'])
-            self.screen.blit(desc_surface, (content_x, current_y))
-            current_y += 18
-        
-        current_y += 8
-        
-        # Features (limited to fit in card)
-        max_features = 2
-        for feature in item.get('features', [])[:max_features]:
-            wrapped_feature = self.wrap_text(f"• {feature}", self.font_small, content_width - 10)
-            for line in wrapped_feature[:1]:
-                feature_text = self.font_small.render(line, True, self.colors['text_secondary'])
-                self.screen.blit(feature_text, (content_x + 5, current_y))
-                current_y += 16
-        
-        # Launch button
-        pygame.draw.rect(self.screen, button_color, button_rect, border_radius=8)
-        
-        button_text_content = "Launch" if is_interactive else "View"
-        button_text = self.font_body.render(button_text_content, True, (255, 255, 255))
-        button_text_rect = button_text.get_rect(center=button_rect.center)
-        self.screen.blit(button_text, button_text_rect)
+            for surface, rect in self._static_surfaces['static_header']:
+                self.screen.blit(surface, rect.move(0, -self.scroll_y))
     
     def draw_scroll_indicator(self):
         """Draw scroll indicator if content is scrollable"""
@@ -423,48 +739,69 @@ class TimePixelMainMenu:
             
             pygame.draw.rect(self.screen, self.colors['accent'], (bar_x + 2, indicator_y, 11, indicator_height), border_radius=5)
     
-    def draw_footer(self):
-        """Draw footer with instructions"""
-        footer_y = self.height - 80
-        
-        instructions = [
-            "Scroll: Mouse wheel/arrows • Click: Launch • 1-6: Quick access • ESC: Exit",
-            "Tip: Try Timelapse Animation first!"
-        ]
-        
-        for i, instruction in enumerate(instructions):
-            color = self.colors['accent'] if i == 1 else self.colors['text_secondary']
-            font = self.font_body if i == 1 else self.font_small
-            
-            text = font.render(instruction, True, color)
-            text_rect = text.get_rect(center=(self.width // 2, footer_y + i * 25))
-            self.screen.blit(text, text_rect)
-    
     def draw(self):
         """Draw the entire menu with scroll support"""
-        # Clear screen
-        self.screen.fill(self.colors['background'])
+        self.hover_state = self.get_hover_state()
         
-        # Draw components (header stays fixed)
-        self.draw_header()
+        # Background, header and footer; between full presents only the
+        # scrolling band is restored, as nothing outside it ever changes
+        if self.full_update:
+            self.screen.blit(self._chrome, (0, 0))
+        else:
+            self.screen.blit(self._chrome, self.update_area, self.update_area)
         
-        # Draw scrollable content
+        # Draw scrollable content, clipped between the fixed header and footer
+        self.screen.set_clip(self.scroll_area)
         self.draw_categories()
         
-        # Draw cards
-        for i, item in enumerate(self.menu_items):
-            self.draw_card(i, item)
+        # Draw cards: one batched blits call of the composed surfaces for the
+        # current hover state, each shifted by the scroll offset
+        hovered_card, hovered_button = self.hover_state
+        scroll_y = self.scroll_y
+        composed = self._composed_cards
+        self.screen.blits([
+            (composed[(i, hovered_card == i, hovered_button == i)], (x, y - scroll_y), None,
+             pygame.BLEND_PREMULTIPLIED)
+            for i, (x, y) in enumerate(self._base_card_xy)
+        ], doreturn=False)
+        self.screen.set_clip(None)
         
         # Draw UI elements
         self.draw_scroll_indicator()
-        self.draw_footer()
         
-        # Update display
-        pygame.display.flip()
+        # Update display; the header and footer never change, so after a full
+        # present only the scrolling band needs to reach the window
+        if self.full_update:
+            pygame.display.flip()
+            self.full_update = False
+        else:
+            pygame.display.update(self.update_area)
     
     def update(self):
-        """Update the menu state"""
-        pass
+        """Update the menu state, reporting visualizations that have exited"""
+        if not self._children:
+            return
+        running = []
+        for script_path, process in self._children:
+            returncode = _exit_code(process)
+            if returncode is None:
+                running.append((script_path, process))
+            else:
+                print(f"Visualization {script_path} completed with code: {returncode}")
+        self._children = running
+    
+    def close_children(self):
+        """Close visualizations still running when the menu exits
+        
+        Launched processes are not daemonic, so multiprocessing would otherwise
+        join them at interpreter exit and the menu would hang until every
+        visualization window was closed by hand.
+        """
+        self.update()
+        for script_path, process in self._children:
+            print(f"Closing visualization: {script_path}")
+            _stop_child(process)
+        self._children = []
     
     def run(self):
         """Main menu loop"""
@@ -474,21 +811,26 @@ class TimePixelMainMenu:
         print()
         print("INTERACTIVE VISUALIZATIONS:")
         for i, item in enumerate(self.interactive_items, 1):
-            print(f"  {i}. {item['title']}")
+            print(f"  {i}. {item.title}")
         print()
         print("STATIC IMAGE GALLERY:")
         for i, item in enumerate(self.static_items, 4):
-            print(f"  {i}. {item['title']}")
+            print(f"  {i}. {item.title}")
         print()
         print("Controls: Click buttons, scroll, press 1-6, ESC to exit")
         print("=" * 40)
         
         while self.running:
-            self.handle_events()
+            # Sleep until an event arrives (or a short timeout) instead of
+            # redrawing identical frames at a fixed rate, then take the rest of the queue
+            self.handle_events([pygame.event.wait(100)] + pygame.event.get())
             self.update()
-            self.draw()
-            self.clock.tick(60)
+            
+            if self.dirty:
+                self.draw()
+                self.dirty = False
         
+        self.close_children()
         pygame.quit()
         print("\\nThanks for using Time's Pixel!")
 
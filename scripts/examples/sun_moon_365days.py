@@ -12,54 +12,46 @@ SUNSET_COLOR = (255, 120, 60)   # Sun is going down
 MOONRISE_COLOR = (120, 120, 255) # Moon is rising
 
 # Load cleaned sun and moon data
-sun_df = pd.read_csv('hongkong_sunrise_sunset_2024_clean.csv')
-moon_df = pd.read_csv('moonrise_moonset_2024_clean.csv')
+sun_df = pd.read_csv('hongkong_sunrise_sunset_2024_clean.csv', usecols=['RISE', 'SET'], dtype=str)
+moon_df = pd.read_csv('moonrise_moonset_2024_clean.csv', usecols=['RISE', 'SET'], dtype=str)
 
-# Helper to convert HH:MM to hour as float
-def time_to_hour(t):
-    if pd.isna(t) or t == '':
-        return None
-    h, m = map(int, str(t).split(':'))
-    return h + m / 60.0
+# Helper to convert a column of HH:MM strings to float hours in one vectorized
+# parse; missing or malformed times become NaN
+def times_to_hours(values):
+    return (pd.to_timedelta(values + ':00', errors='coerce').dt.total_seconds() / 3600.0).to_numpy()
 
-pixels = []
-for idx in range(IMG_HEIGHT):
-    if idx >= len(sun_df) or idx >= len(moon_df):
-        break
-    row = sun_df.iloc[idx]
-    sunrise = time_to_hour(row['RISE'])
-    sunset = time_to_hour(row['SET'])
-    moon_row = moon_df.iloc[idx]
-    moonrise = time_to_hour(moon_row['RISE'])
-    moonset = time_to_hour(moon_row['SET'])
-    day_pixels = []
-    for hour in range(IMG_WIDTH):
-        color = NIGHT_COLOR
-        # Daytime
-        if sunrise is not None and sunset is not None and sunrise <= hour < sunset:
-            color = BRIGHT_COLOR
-            # Near sunset (last hour before sunset)
-            if sunset - hour <= 1 and sunset - hour > 0:
-                color = SUNSET_COLOR
-        # Moon up
-        moon_up = False
-        if moonrise is not None and moonset is not None:
-            if moonrise < moonset:
-                moon_up = moonrise <= hour < moonset
-            else:
-                moon_up = hour >= moonrise or hour < moonset
-        if moon_up:
-            # Moon is rising (first hour after moonrise)
-            if hour - moonrise < 1 and hour - moonrise >= 0:
-                color = MOONRISE_COLOR
-            else:
-                color = tuple(np.mean([color, MOON_COLOR], axis=0).astype(int))
-        day_pixels.append(color)
-    pixels.append(day_pixels)
+# One row per day, one column per hour; all pixels are computed at once
+num_days = min(IMG_HEIGHT, len(sun_df), len(moon_df))
+sunrise = times_to_hours(sun_df['RISE'][:num_days])[:, None]
+sunset = times_to_hours(sun_df['SET'][:num_days])[:, None]
+moonrise = times_to_hours(moon_df['RISE'][:num_days])[:, None]
+moonset = times_to_hours(moon_df['SET'][:num_days])[:, None]
+hours = np.arange(IMG_WIDTH)[None, :]
+
+# Daytime, with the last hour before sunset marked separately
+day = (sunrise <= hours) & (hours < sunset)
+near_sunset = day & (sunset - hours <= 1) & (sunset - hours > 0)
+
+# Moon up, wrapping past midnight when it sets before it rises
+has_moon = ~np.isnan(moonrise) & ~np.isnan(moonset)
+moon_up = has_moon & np.where(moonrise < moonset,
+                              (moonrise <= hours) & (hours < moonset),
+                              (hours >= moonrise) | (hours < moonset))
+# Moon is rising (first hour after moonrise)
+moon_rising = moon_up & (hours - moonrise < 1) & (hours - moonrise >= 0)
+
+# Rows past the end of the data stay black
+pixels = np.zeros((IMG_HEIGHT, IMG_WIDTH, 3), dtype=np.uint8)
+color = pixels[:num_days]
+color[:] = NIGHT_COLOR
+color[day] = BRIGHT_COLOR
+color[near_sunset] = SUNSET_COLOR
+# Elsewhere the moon averages with the sky, rounding down
+moon_blend = moon_up & ~moon_rising
+color[moon_blend] = (color[moon_blend].astype(np.int32) + MOON_COLOR) // 2
+color[moon_rising] = MOONRISE_COLOR
 
 # Create pixel art image (365 lines, each line is a day)
-img = Image.new('RGB', (IMG_WIDTH, IMG_HEIGHT))
-pixels_flat = [px for row in pixels for px in row]
-img.putdata(pixels_flat)
+img = Image.fromarray(pixels, 'RGB')
 img.save('sun_moon_365days.png')
 print('Visualization saved as sun_moon_365days.png')
@@ -1,7 +1,6 @@
 
 # --- New Fullscreen Daytime Animation ---
 import pandas as pd
-import numpy as np
 import pygame
 import sys
 
@@ -16,14 +15,18 @@ MOONRISE_COLOR = (120, 120, 255)
 BG_COLOR = (10, 10, 20)
 
 # Load cleaned sun and moon data
-sun_df = pd.read_csv('hongkong_sunrise_sunset_2024_clean.csv')
-moon_df = pd.read_csv('moonrise_moonset_2024_clean.csv')
+sun_df = pd.read_csv('hongkong_sunrise_sunset_2024_clean.csv', usecols=['RISE', 'SET'], dtype=str)
+moon_df = pd.read_csv('moonrise_moonset_2024_clean.csv', usecols=['RISE', 'SET'], dtype=str)
 
-def time_to_hour(t):
-    if pd.isna(t) or t == '':
-        return None
-    h, m = map(int, str(t).split(':'))
-    return h + m / 60.0
+# Helper to convert a column of HH:MM strings to float hours in one vectorized
+# parse; missing or malformed times become None
+def times_to_hours(values):
+    hours = pd.to_timedelta(values + ':00', errors='coerce').dt.total_seconds() / 3600.0
+    return hours.astype(object).where(hours.notna(), None).tolist()
+
+# Every rise/set time parsed up front, None where missing
+sunrises, sunsets = times_to_hours(sun_df['RISE']), times_to_hours(sun_df['SET'])
+moonrises, moonsets = times_to_hours(moon_df['RISE']), times_to_hours(moon_df['SET'])
 
 # Get screen size
 pygame.init()
@@ -36,12 +39,8 @@ pygame.display.set_caption('Sun & Moon Daytime Animation')
 clock = pygame.time.Clock()
 
 def get_day_pixels(idx):
-    row = sun_df.iloc[idx]
-    sunrise = time_to_hour(row['RISE'])
-    sunset = time_to_hour(row['SET'])
-    moon_row = moon_df.iloc[idx]
-    moonrise = time_to_hour(moon_row['RISE'])
-    moonset = time_to_hour(moon_row['SET'])
+    sunrise, sunset = sunrises[idx], sunsets[idx]
+    moonrise, moonset = moonrises[idx], moonsets[idx]
     day_pixels = []
     for hour in range(IMG_WIDTH):
         color = NIGHT_COLOR
@@ -59,7 +58,7 @@ def get_day_pixels(idx):
             if hour - moonrise < 1 and hour - moonrise >= 0:
                 color = MOONRISE_COLOR
             else:
-                color = tuple(np.mean([color, MOON_COLOR], axis=0).astype(int))
+                color = ((color[0] + MOON_COLOR[0]) >> 1, (color[1] + MOON_COLOR[1]) >> 1, (color[2] + MOON_COLOR[2]) >> 1)
         day_pixels.append(color)
     return day_pixels
 
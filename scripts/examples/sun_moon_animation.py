@@ -1,6 +1,5 @@
 import pandas as pd
 import numpy as np
-from PIL import Image, ImageDraw
 import imageio
 
 # Configurable parameters
@@ -13,23 +12,23 @@ SUNSET_COLOR = (255, 120, 60)   # Sun is going down
 MOONRISE_COLOR = (120, 120, 255) # Moon is rising
 
 # Load cleaned sun and moon data
-sun_df = pd.read_csv('hongkong_sunrise_sunset_2024_clean.csv')
-moon_df = pd.read_csv('moonrise_moonset_2024_clean.csv')
+sun_df = pd.read_csv('hongkong_sunrise_sunset_2024_clean.csv', usecols=['RISE', 'SET'], dtype=str)
+moon_df = pd.read_csv('moonrise_moonset_2024_clean.csv', usecols=['RISE', 'SET'], dtype=str)
 
-# Helper to convert HH:MM to hour as float
-def time_to_hour(t):
-    if pd.isna(t) or t == '':
-        return None
-    h, m = map(int, str(t).split(':'))
-    return h + m / 60.0
+# Helper to convert a column of HH:MM strings to float hours in one vectorized
+# parse; missing or malformed times become None
+def times_to_hours(values):
+    hours = pd.to_timedelta(values + ':00', errors='coerce').dt.total_seconds() / 3600.0
+    return hours.astype(object).where(hours.notna(), None).tolist()
+
+# Every rise/set time parsed up front, None where missing
+sunrises, sunsets = times_to_hours(sun_df['RISE']), times_to_hours(sun_df['SET'])
+moonrises, moonsets = times_to_hours(moon_df['RISE']), times_to_hours(moon_df['SET'])
 
 frames = []
-for idx, row in sun_df.iterrows():
-    sunrise = time_to_hour(row['RISE'])
-    sunset = time_to_hour(row['SET'])
-    moon_row = moon_df.iloc[idx]
-    moonrise = time_to_hour(moon_row['RISE'])
-    moonset = time_to_hour(moon_row['SET'])
+for idx in range(len(sun_df)):
+    sunrise, sunset = sunrises[idx], sunsets[idx]
+    moonrise, moonset = moonrises[idx], moonsets[idx]
     day_pixels = []
     for hour in range(24):
         color = NIGHT_COLOR
@@ -51,12 +50,12 @@ for idx, row in sun_df.iterrows():
             if hour - moonrise < 1 and hour - moonrise >= 0:
                 color = MOONRISE_COLOR
             else:
-                color = tuple(np.mean([color, MOON_COLOR], axis=0).astype(int))
+                color = ((color[0] + MOON_COLOR[0]) >> 1, (color[1] + MOON_COLOR[1]) >> 1, (color[2] + MOON_COLOR[2]) >> 1)
         day_pixels.append(color)
-    # Create image for this day
-    img = Image.new('RGB', (IMG_WIDTH, IMG_HEIGHT))
-    img.putdata(day_pixels)
-    frames.append(np.array(img))
+    # Frame for this day, the hour pixels filling it row by row
+    frame = np.zeros((IMG_HEIGHT, IMG_WIDTH, 3), dtype=np.uint8)
+    frame.reshape(-1, 3)[:len(day_pixels)] = day_pixels
+    frames.append(frame)
 
 # Save as GIF animation
 imageio.mimsave('sun_moon_animation_2024.gif', frames, duration=0.1)
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Generated Image Display
+Shared entry point for the gallery launchers: show a previously generated
+image from output/images in the image viewer
+"""
+
+import sys
+import os
+
+# Project paths, resolved once at import
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+images_dir = os.path.join(project_root, "output", "images")
+scripts_dir = os.path.join(project_root, "scripts")  # holds image_viewer.py
+if scripts_dir not in sys.path:
+    sys.path.insert(0, scripts_dir)
+
+def show(image_name, heading, features, label):
+    """Open output/images/<image_name> in the image viewer within this process.
+    
+    heading and features are the opening lines printed first; label names the
+    visualization in the completion and error messages.
+    """
+    try:
+        print(heading)
+        print(features)
+        print("=" * 60)
+        
+        image_path = os.path.join(images_dir, image_name)
+        
+        if not os.path.exists(image_path):
+            print(f"❌ Image not found: {image_path}")
+            print("💡 Try running the image generation script first")
+            return
+        
+        # Run the viewer here rather than in another interpreter
+        from image_viewer import ImageViewer
+        viewer = ImageViewer(image_path, "Time's Pixel Gallery")
+        viewer.run()
+        
+        print(f"✅ {label[0].upper() + label[1:]} display completed!")
+        
+    except Exception as e:
+        print(f"❌ Error displaying {label}: {e}")
+        import traceback
+        traceback.print_exc()
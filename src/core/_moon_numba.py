@@ -0,0 +1,31 @@
+"""
+JIT-compiled moon phase math for MoonPhaseCalculator.
+Each kernel keeps the scalar code's order of operations, so phases and
+illuminations are bit-identical to the pure-Python formulas.
+"""
+import math
+
+import numpy as np
+
+from src.core._numba_compat import njit, prange
+
+@njit(cache=True)
+def phase_and_illumination(days_since_reference, lunar_cycle_days):
+    """Return (phase, illumination) for a time in days since a reference new moon.
+
+    phase is 0 at new moon and 0.5 at full moon; illumination is the lit
+    fraction (0-1).
+    """
+    phase = (days_since_reference % lunar_cycle_days) / lunar_cycle_days
+    illumination = (1 - math.cos(2 * math.pi * phase)) / 2
+    return phase, illumination
+
+@njit(cache=True, parallel=True)
+def illumination_array(days_since_reference, lunar_cycle_days):
+    """phase_and_illumination over a 1-D float64 array; returns (phase, illumination) arrays."""
+    n = len(days_since_reference)
+    phase = np.empty(n, dtype=np.float64)
+    illumination = np.empty(n, dtype=np.float64)
+    for i in prange(n):
+        phase[i], illumination[i] = phase_and_illumination(days_since_reference[i], lunar_cycle_days)
+    return phase, illumination
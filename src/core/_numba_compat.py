@@ -0,0 +1,18 @@
+"""
+Optional Numba support for Time's Pixel.
+When Numba is not installed, njit becomes a no-op decorator and prange falls
+back to range, so JIT kernels still run as plain Python.
+"""
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that returns the function unchanged."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
@@ -0,0 +1,178 @@
+"""
+JIT-compiled color kernels for the ColorPalette hot path.
+The HSV conversions mirror colorsys exactly so results match the original
+pure-Python implementation pixel for pixel.
+"""
+import math
+from enum import IntEnum
+
+import numpy as np
+
+from src.core._numba_compat import njit, prange
+
+class BaseColor(IntEnum):
+    """Row index of each ColorPalette base color; names match the base_colors keys."""
+    NIGHT = 0
+    DAWN = 1
+    DAY = 2
+    SUNSET = 3
+    MOON = 4
+    MOON_BRIGHT = 5
+    MOON_DIM = 6
+
+# Plain ints so the compiled kernels see them as constants
+NIGHT, DAWN, DAY, SUNSET = (
+    int(BaseColor.NIGHT), int(BaseColor.DAWN), int(BaseColor.DAY), int(BaseColor.SUNSET)
+)
+MOON_BRIGHT, MOON_DIM = int(BaseColor.MOON_BRIGHT), int(BaseColor.MOON_DIM)
+
+@njit(cache=True)
+def _rgb_to_hsv(r, g, b):
+    """colorsys.rgb_to_hsv for floats in [0, 1]."""
+    maxc = max(r, g, b)
+    minc = min(r, g, b)
+    v = maxc
+    if minc == maxc:
+        return 0.0, 0.0, v
+    rangec = maxc - minc
+    s = rangec / maxc
+    rc = (maxc - r) / rangec
+    gc = (maxc - g) / rangec
+    bc = (maxc - b) / rangec
+    if r == maxc:
+        h = bc - gc
+    elif g == maxc:
+        h = 2.0 + rc - bc
+    else:
+        h = 4.0 + gc - rc
+    h = (h / 6.0) % 1.0
+    return h, s, v
+
+@njit(cache=True)
+def _hsv_to_rgb(h, s, v):
+    """colorsys.hsv_to_rgb for floats in [0, 1]."""
+    if s == 0.0:
+        return v, v, v
+    i = int(h * 6.0)
+    f = (h * 6.0) - i
+    p = v * (1.0 - s)
+    q = v * (1.0 - s * f)
+    t = v * (1.0 - s * (1.0 - f))
+    i = i % 6
+    if i == 0:
+        return v, t, p
+    if i == 1:
+        return q, v, p
+    if i == 2:
+        return p, v, t
+    if i == 3:
+        return p, q, v
+    if i == 4:
+        return t, p, v
+    return v, p, q
+
+@njit(cache=True)
+def seasonal_tint_hsv(h, s, v, day_of_year, intensity):
+    """Seasonal tint for a color already converted to HSV."""
+    modifier = math.sin(2 * math.pi * (day_of_year - 80) / 365)
+    
+    h = (h + modifier * intensity * 0.1) % 1.0
+    s = max(0.0, min(1.0, s + modifier * intensity * 0.2))
+    
+    r_new, g_new, b_new = _hsv_to_rgb(h, s, v)
+    return int(r_new * 255), int(g_new * 255), int(b_new * 255)
+
+@njit(cache=True)
+def seasonal_tint_rgb(r, g, b, day_of_year, intensity):
+    """Shift hue and saturation by season; same math as ColorPalette.apply_seasonal_tint."""
+    h, s, v = _rgb_to_hsv(r / 255, g / 255, b / 255)
+    return seasonal_tint_hsv(h, s, v, day_of_year, intensity)
+
+@njit(cache=True)
+def _blend_row(colors, i1, i2, factor):
+    """Blend two rows of the base color array, truncating like ColorPalette._blend_colors."""
+    factor = max(0.0, min(1.0, factor))
+    r = int(colors[i1, 0] + (colors[i2, 0] - colors[i1, 0]) * factor)
+    g = int(colors[i1, 1] + (colors[i2, 1] - colors[i1, 1]) * factor)
+    b = int(colors[i1, 2] + (colors[i2, 2] - colors[i1, 2]) * factor)
+    return r, g, b
+
+@njit(cache=True)
+def twilight_color_core(time_hour, sunrise_hour, sunset_hour, day_of_year, colors, colors_hsv):
+    """Twilight color for one hour given RGB and HSV base color arrays indexed by BaseColor."""
+    dawn_start = sunrise_hour - 0.5
+    dawn_end = sunrise_hour + 0.5
+    dusk_start = sunset_hour - 0.5
+    dusk_end = sunset_hour + 0.5
+    
+    if dawn_start <= time_hour <= dawn_end:
+        progress = (time_hour - dawn_start) / (dawn_end - dawn_start)
+        r, g, b = _blend_row(colors, NIGHT, DAWN, progress)
+    elif dawn_end < time_hour < dusk_start:
+        # Unblended base colors reuse their precomputed HSV
+        h, s, v = colors_hsv[DAY]
+        return seasonal_tint_hsv(h, s, v, day_of_year, 0.3)
+    elif dusk_start <= time_hour <= dusk_end:
+        progress = (time_hour - dusk_start) / (dusk_end - dusk_start)
+        r, g, b = _blend_row(colors, DAY, SUNSET, progress)
+    elif dusk_end < time_hour <= dusk_end + 1:
+        progress = (time_hour - dusk_end) / 1.0
+        r, g, b = _blend_row(colors, SUNSET, NIGHT, progress)
+    else:
+        h, s, v = colors_hsv[NIGHT]
+        return seasonal_tint_hsv(h, s, v, day_of_year, 0.3)
+    
+    return seasonal_tint_rgb(r, g, b, day_of_year, 0.3)
+
+@njit(cache=True)
+def moon_phase_vec(day_of_year):
+    """get_moon_phase over an array of days of year (simplified 29.53-day cycle)."""
+    phase_progress = ((day_of_year - 11) % 29.53) / 29.53
+    return (1 - np.cos(2 * np.pi * phase_progress)) / 2
+
+@njit(cache=True)
+def seasonal_modifier_vec(day_of_year):
+    """ColorPalette.get_seasonal_modifier over an array of days of year."""
+    return np.sin(2 * np.pi * (day_of_year - 80) / 365)
+
+@njit(cache=True, parallel=True)
+def hour_pixels_batch(sunrise, sunset, moonrise, moonset, day_of_year, moon_phase,
+                      colors, colors_hsv, out):
+    """generate_hour_pixels for many palettes and days into out[(P, D, H, 3)] uint8.
+
+    colors and colors_hsv are (P, len(BaseColor), 3) stacks of each palette's
+    base color arrays; per-day inputs are (D,) with NaN for missing times and
+    day_of_year already defaulted to 1.
+    """
+    for p in prange(out.shape[0]):
+        for d in range(out.shape[1]):
+            sr, ss, doy = sunrise[d], sunset[d], day_of_year[d]
+            mr, ms = moonrise[d], moonset[d]
+            has_sun = not (np.isnan(sr) or np.isnan(ss))
+            has_moon = not (np.isnan(mr) or np.isnan(ms))
+            
+            # Moon color only depends on the day: dim-to-bright by phase, then tinted
+            moon_r, moon_g, moon_b = _blend_row(colors[p], MOON_DIM, MOON_BRIGHT, moon_phase[d])
+            moon_r, moon_g, moon_b = seasonal_tint_rgb(moon_r, moon_g, moon_b, doy, 0.2)
+            
+            for h in range(out.shape[2]):
+                if has_sun:
+                    r, g, b = twilight_color_core(h, sr, ss, doy, colors[p], colors_hsv[p])
+                else:
+                    r, g, b = int(colors[p, NIGHT, 0]), int(colors[p, NIGHT, 1]), int(colors[p, NIGHT, 2])
+                
+                moon_up = False
+                if has_moon:
+                    if mr < ms:
+                        moon_up = mr <= h < ms
+                    else:
+                        moon_up = h >= mr or h < ms
+                
+                if moon_up:
+                    # time_utils.overlay_color at 40% opacity
+                    r = int(r * (1 - 0.4) + moon_r * 0.4)
+                    g = int(g * (1 - 0.4) + moon_g * 0.4)
+                    b = int(b * (1 - 0.4) + moon_b * 0.4)
+                out[p, d, h, 0] = r
+                out[p, d, h, 1] = g
+                out[p, d, h, 2] = b
@@ -0,0 +1,46 @@
+"""
+JIT-compiled per-pixel color kernels shared by the visualizations.
+Results match the pure-Python helpers exactly, including int() truncation
+and the Q8 fixed-point overlay, so they can be swapped in without changing
+any pixel.
+"""
+import numpy as np
+
+from src.core._numba_compat import njit
+
+def opacity_to_q8(opacity):
+    """Convert an opacity in [0, 1] to Q8 fixed point (0-256)."""
+    return max(0, min(256, round(opacity * 256)))
+
+@njit(cache=True)
+def overlay_rgb(base_color, overlay_color, op8):
+    """Overlay one RGB color on another with a Q8 (0-256) opacity weight."""
+    r = (base_color[0] * (256 - op8) + overlay_color[0] * op8) >> 8
+    g = (base_color[1] * (256 - op8) + overlay_color[1] * op8) >> 8
+    b = (base_color[2] * (256 - op8) + overlay_color[2] * op8) >> 8
+    return r, g, b
+
+@njit(cache=True)
+def brighten_rgb(color, factor):
+    """Scale an RGB color by factor, capping each channel at 255."""
+    r = min(255, int(color[0] * factor))
+    g = min(255, int(color[1] * factor))
+    b = min(255, int(color[2] * factor))
+    return r, g, b
+
+@njit(cache=True)
+def brighten_array(colors, factors):
+    """brighten_rgb over an (N, 3) color array with one factor per row; returns (N, 3) uint8."""
+    out = np.empty((colors.shape[0], 3), dtype=np.uint8)
+    for i in range(colors.shape[0]):
+        for c in range(3):
+            out[i, c] = min(255, int(colors[i, c] * factors[i]))
+    return out
+
+@njit(cache=True)
+def overlay_array(colors, overlay_color, op8s):
+    """overlay_rgb over an (N, 3) color array with one Q8 weight per row; returns (N, 3) uint8."""
+    out = np.empty((colors.shape[0], 3), dtype=np.uint8)
+    for i in range(colors.shape[0]):
+        out[i, 0], out[i, 1], out[i, 2] = overlay_rgb(colors[i], overlay_color, op8s[i])
+    return out
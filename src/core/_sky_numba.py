@@ -0,0 +1,159 @@
+"""
+JIT-compiled whole-year renderer for the AdvancedSkyPalette sky plus moon overlay.
+Each step mirrors the scalar TwilightCalculator / AdvancedSkyPalette code,
+including the order of floating-point operations and int() truncation, so
+the output matches get_advanced_sky_color pixel for pixel.
+"""
+import math
+
+import numpy as np
+
+from src.core._numba_compat import njit, prange
+
+# Twilight phases in TwilightCalculator.twilight_angles order
+CIVIL, NAUTICAL, ASTRONOMICAL, BLUE_HOUR, GOLDEN_HOUR = range(5)
+
+# Sky type codes in twilight_calculator.SKY_TYPES order
+(NIGHT, ASTRONOMICAL_TWILIGHT, NAUTICAL_TWILIGHT, CIVIL_MORNING, CIVIL_EVENING,
+ BLUE_MORNING, BLUE_EVENING, GOLDEN, DAY) = range(9)
+
+@njit(cache=True)
+def _radians(x):
+    """math.radians exactly as CPython computes it."""
+    return x * (math.pi / 180.0)
+
+@njit(cache=True)
+def twilight_bounds(day_of_year, sunrise, sunset, latitude, angles):
+    """Morning/evening times per twilight phase; TwilightCalculator.calculate_twilight_times."""
+    declination = _radians(23.45 * math.sin(_radians(360 * (284 + day_of_year) / 365)))
+    solar_noon = (sunrise + sunset) / 2
+    morning = np.empty(angles.shape[0])
+    evening = np.empty(angles.shape[0])
+
+    for i in range(angles.shape[0]):
+        elev = _radians(-angles[i])
+        cos_hour_angle = (math.sin(elev) - math.sin(latitude) * math.sin(declination)) / (
+            math.cos(latitude) * math.cos(declination))
+        cos_hour_angle = max(-1.0, min(1.0, cos_hour_angle))
+        hours_from_noon = math.acos(cos_hour_angle) * 12 / math.pi
+
+        if angles[i] > 0:  # Below horizon (twilight)
+            morning[i] = solar_noon - hours_from_noon
+            evening[i] = solar_noon + hours_from_noon
+        else:  # Above horizon (golden hour)
+            morning[i] = sunrise + abs(hours_from_noon)
+            evening[i] = sunset - abs(hours_from_noon)
+    return morning, evening
+
+@njit(cache=True)
+def sky_type_code(hour, sunrise, sunset, morning, evening):
+    """TwilightCalculator.get_sky_type as a SKY_TYPES code, for a day with sun data."""
+    if sunrise <= hour <= sunset:
+        if hour <= morning[GOLDEN_HOUR] or hour >= evening[GOLDEN_HOUR]:
+            return GOLDEN
+        return DAY
+    if hour < sunrise:
+        if hour >= morning[BLUE_HOUR]:
+            return BLUE_MORNING
+        if hour >= morning[CIVIL]:
+            return CIVIL_MORNING
+        if hour >= morning[NAUTICAL]:
+            return NAUTICAL_TWILIGHT
+        if hour >= morning[ASTRONOMICAL]:
+            return ASTRONOMICAL_TWILIGHT
+        return NIGHT
+    if hour <= evening[BLUE_HOUR]:
+        return BLUE_EVENING
+    if hour <= evening[CIVIL]:
+        return CIVIL_EVENING
+    if hour <= evening[NAUTICAL]:
+        return NAUTICAL_TWILIGHT
+    if hour <= evening[ASTRONOMICAL]:
+        return ASTRONOMICAL_TWILIGHT
+    return NIGHT
+
+@njit(cache=True)
+def _seasonal_tint(color, day_of_year, intensity):
+    """AdvancedSkyPalette.apply_seasonal_tint for one (3,) color."""
+    r, g, b = color[0], color[1], color[2]
+    season_factor = math.sin(2 * math.pi * (day_of_year - 80) / 365)
+    if season_factor > 0:  # Summer - warmer
+        r = min(255, int(r * (1 + intensity * season_factor * 0.2)))
+        g = min(255, int(g * (1 + intensity * season_factor * 0.1)))
+    else:  # Winter - cooler
+        b = min(255, int(b * (1 + intensity * abs(season_factor) * 0.3)))
+        g = max(0, int(g * (1 - intensity * abs(season_factor) * 0.1)))
+    return r, g, b
+
+@njit(cache=True)
+def _blend_into(out, color1, color2, factor):
+    """AdvancedSkyPalette.blend_colors written into a (3,) output row."""
+    factor = max(0.0, min(1.0, factor))
+    for c in range(3):
+        out[c] = int(color1[c] + (color2[c] - color1[c]) * factor)
+
+@njit(cache=True, parallel=True)
+def render_year(sunrise, sunset, moonrise, moonset, day_of_year, moon_color, opacity_q8,
+                type_colors, transition_colors, latitude, angles, out, sky_types):
+    """Fill out[(D, H, 3)] uint8 with sky colors and the moon overlay for every day and hour.
+
+    sky_types[(D, H)] receives the SKY_TYPES code behind each pixel.
+
+    Times are NaN when missing; type_colors is (9, 3) in SKY_TYPES order and
+    transition_colors holds the sunrise, day and sunset colors. moon_color (D, 3)
+    and the Q8 (0-256) opacity_q8 (D,) give each day's overlay, blended in fixed
+    point; moon hours wrap past midnight.
+    """
+    transition_width = 0.5
+    sunrise_color = transition_colors[0]
+    day_color = transition_colors[1]
+    sunset_color = transition_colors[2]
+
+    for d in prange(out.shape[0]):
+        sr, ss, doy = sunrise[d], sunset[d], day_of_year[d]
+        has_sun = not (np.isnan(sr) or np.isnan(ss))
+        # A missing or midnight time skips its transition, as in the scalar code
+        smooth_sunrise = not np.isnan(sr) and sr != 0.0
+        smooth_sunset = not np.isnan(ss) and ss != 0.0
+        morning = np.empty(angles.shape[0])
+        evening = np.empty(angles.shape[0])
+        if has_sun:
+            morning, evening = twilight_bounds(doy, sr, ss, latitude, angles)
+
+        tinted = np.empty((type_colors.shape[0], 3))
+        for t in range(type_colors.shape[0]):
+            tinted[t, 0], tinted[t, 1], tinted[t, 2] = _seasonal_tint(type_colors[t], doy, 0.2)
+
+        # Moon is up from moonrise for the span to moonset, modulo 24
+        duration = (moonset[d] - moonrise[d]) % 24.0
+        if duration == 0.0:
+            duration = 24.0
+
+        sky = np.empty(3)
+        for h in range(out.shape[1]):
+            hour = float(h)
+            code = sky_type_code(hour, sr, ss, morning, evening) if has_sun else NIGHT
+            sky_types[d, h] = code
+            base = tinted[code]
+
+            # Smooth transitions around sunrise, then sunset
+            if smooth_sunrise and abs(hour - sr) <= transition_width:
+                if hour < sr:
+                    _blend_into(sky, sunrise_color, base, (sr - hour) / transition_width)
+                else:
+                    _blend_into(sky, base, day_color, (hour - sr) / transition_width)
+            elif smooth_sunset and abs(hour - ss) <= transition_width:
+                if hour < ss:
+                    _blend_into(sky, day_color, sunset_color, 1 - (ss - hour) / transition_width)
+                else:
+                    _blend_into(sky, sunset_color, base, (hour - ss) / transition_width)
+            else:
+                sky[:] = base
+
+            if (hour - moonrise[d]) % 24.0 < duration:
+                op = opacity_q8[d]
+                for c in range(3):
+                    out[d, h, c] = (int(sky[c]) * (256 - op) + moon_color[d, c] * op) >> 8
+            else:
+                for c in range(3):
+                    out[d, h, c] = int(sky[c])
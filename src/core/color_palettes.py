@@ -3,10 +3,15 @@ Enhanced Color Palette System for Time's Pixel
 Provides seasonal color gradients, twilight transitions, and dynamic color temperature changes.
 """
 import numpy as np
-import colorsys
+from dataclasses import dataclass
 from datetime import datetime, date
 import math
 
+from src.core._palette_numba import (
+    BaseColor, _rgb_to_hsv, moon_phase_vec, seasonal_modifier_vec,
+    seasonal_tint_rgb, twilight_color_core
+)
+
 class ColorPalette:
     """Base class for color palettes with seasonal and time-based variations."""
     
@@ -20,6 +25,21 @@ class ColorPalette:
             'moon_bright': (220, 220, 255),
             'moon_dim': (100, 100, 150)
         }
+        
+        # Base colors as (len(BaseColor), 3) RGB and HSV float arrays, built on
+        # first use so that subclass updates to base_colors are picked up
+        self._colors = None
+        self._colors_hsv = None
+    
+    def _color_arrays(self):
+        """Base colors as RGB and HSV float64 arrays with rows indexed by BaseColor."""
+        if self._colors is None:
+            names = [color.name.lower() for color in BaseColor]
+            self._colors = np.array([self.base_colors[name] for name in names], dtype=np.float64)
+            self._colors_hsv = np.array(
+                [_rgb_to_hsv(r / 255, g / 255, b / 255) for r, g, b in self._colors], dtype=np.float64
+            )
+        return self._colors, self._colors_hsv
     
     def get_seasonal_modifier(self, day_of_year):
         """Get seasonal color modifier based on day of year (1-365)."""
@@ -29,67 +49,55 @@ class ColorPalette:
     
     def apply_seasonal_tint(self, color, day_of_year, intensity=0.3):
         """Apply seasonal color tinting to a base color."""
-        r, g, b = color
-        modifier = self.get_seasonal_modifier(day_of_year)
-        
-        # Convert to HSV for easier color manipulation
-        h, s, v = colorsys.rgb_to_hsv(r/255, g/255, b/255)
-        
-        # Adjust hue and saturation based on season
         # Summer: warmer (more red/orange), Winter: cooler (more blue)
-        h_shift = modifier * intensity * 0.1  # Shift hue slightly
-        s_shift = modifier * intensity * 0.2  # Adjust saturation
-        
-        h = (h + h_shift) % 1.0
-        s = max(0, min(1, s + s_shift))
-        
-        # Convert back to RGB
-        r_new, g_new, b_new = colorsys.hsv_to_rgb(h, s, v)
-        return (int(r_new * 255), int(g_new * 255), int(b_new * 255))
+        r, g, b = color
+        return seasonal_tint_rgb(r, g, b, day_of_year, intensity)
     
     def get_twilight_color(self, time_hour, sunrise_hour, sunset_hour, day_of_year):
         """Get color for twilight periods with smooth transitions."""
         if sunrise_hour is None or sunset_hour is None:
             return self.base_colors['night']
         
-        # Define twilight periods (civil twilight = sun 6 degrees below horizon)
+        colors, colors_hsv = self._color_arrays()
+        
+        # Dawn/day/dusk/post-sunset blending plus seasonal tint in one compiled call
+        return twilight_color_core(
+            time_hour, sunrise_hour, sunset_hour, day_of_year, colors, colors_hsv
+        )
+    
+    def get_twilight_colors_vec(self, hours, sunrise_hour, sunset_hour, day_of_year):
+        """Vectorized get_twilight_color over an array of hours; returns (N, 3) uint8."""
+        hours = np.asarray(hours, dtype=np.float64)
+        if sunrise_hour is None or sunset_hour is None:
+            return np.tile(np.array(self.base_colors['night'], dtype=np.uint8), (len(hours), 1))
+        
+        colors = self._color_arrays()[0]
         dawn_start = sunrise_hour - 0.5
         dawn_end = sunrise_hour + 0.5
         dusk_start = sunset_hour - 0.5
         dusk_end = sunset_hour + 0.5
         
-        base_color = self.base_colors['night']
+        # Same ranges as the scalar if/elif chain; np.select keeps the first match
+        m_dawn = (hours >= dawn_start) & (hours <= dawn_end)
+        m_day = (hours > dawn_end) & (hours < dusk_start)
+        m_dusk = (hours >= dusk_start) & (hours <= dusk_end)
+        m_post = (hours > dusk_end) & (hours <= dusk_end + 1)
         
-        # Dawn transition
-        if dawn_start <= time_hour <= dawn_end:
-            progress = (time_hour - dawn_start) / (dawn_end - dawn_start)
-            base_color = self._blend_colors(
-                self.base_colors['night'],
-                self.base_colors['dawn'],
-                progress
-            )
-        # Day time
-        elif dawn_end < time_hour < dusk_start:
-            base_color = self.base_colors['day']
-        # Dusk transition  
-        elif dusk_start <= time_hour <= dusk_end:
-            progress = (time_hour - dusk_start) / (dusk_end - dusk_start)
-            base_color = self._blend_colors(
-                self.base_colors['day'],
-                self.base_colors['sunset'],
-                progress
-            )
-        # Post-sunset transition to night
-        elif dusk_end < time_hour <= dusk_end + 1:
-            progress = (time_hour - dusk_end) / 1.0
-            base_color = self._blend_colors(
-                self.base_colors['sunset'],
-                self.base_colors['night'],
-                progress
-            )
+        def blend(i1, i2, progress):
+            factor = np.clip(progress, 0, 1)[:, None]
+            return np.trunc(colors[i1] + (colors[i2] - colors[i1]) * factor)
         
-        # Apply seasonal tinting
-        return self.apply_seasonal_tint(base_color, day_of_year)
+        rgb = np.select(
+            [m_dawn[:, None], m_day[:, None], m_dusk[:, None], m_post[:, None]],
+            [
+                blend(BaseColor.NIGHT, BaseColor.DAWN, (hours - dawn_start) / (dawn_end - dawn_start)),
+                colors[BaseColor.DAY],
+                blend(BaseColor.DAY, BaseColor.SUNSET, (hours - dusk_start) / (dusk_end - dusk_start)),
+                blend(BaseColor.SUNSET, BaseColor.NIGHT, (hours - dusk_end) / 1.0),
+            ],
+            default=colors[BaseColor.NIGHT]
+        )
+        return seasonal_tint_vec(rgb, day_of_year, 0.3)
     
     def get_moon_color(self, time_hour, moonrise_hour, moonset_hour, moon_phase, day_of_year):
         """Get moon color based on moon phase and position."""
@@ -110,15 +118,18 @@ class ColorPalette:
         moon_intensity = moon_phase
         
         # Blend between dim and bright moon colors
-        moon_color = self._blend_colors(
-            self.base_colors['moon_dim'],
-            self.base_colors['moon_bright'],
-            moon_intensity
-        )
+        moon_color = self._blend(BaseColor.MOON_DIM, BaseColor.MOON_BRIGHT, moon_intensity)
         
         # Apply seasonal tinting
         return self.apply_seasonal_tint(moon_color, day_of_year, intensity=0.2)
     
+    def _blend(self, i1, i2, factor):
+        """Blend two base colors by BaseColor index, truncating like _blend_colors."""
+        factor = max(0, min(1, factor))
+        colors = self._color_arrays()[0]
+        r, g, b = colors[i1] + (colors[i2] - colors[i1]) * factor
+        return (int(r), int(g), int(b))
+    
     def _blend_colors(self, color1, color2, factor):
         """Blend two colors with given factor (0=color1, 1=color2)."""
         factor = max(0, min(1, factor))
@@ -176,6 +187,47 @@ class MonochromePalette(ColorPalette):
             'moon_dim': (100, 100, 100)
         })
 
+def seasonal_tint_vec(rgb, day_of_year, intensity=0.3):
+    """Vectorized ColorPalette.apply_seasonal_tint for an (N, 3) array of RGB values.
+    
+    day_of_year may be a scalar or an (N,) array, so a whole year can be tinted in one call.
+    """
+    modifier = seasonal_modifier_vec(np.atleast_1d(np.asarray(day_of_year, dtype=np.float64)))
+    r, g, b = (np.asarray(rgb, dtype=np.float64) / 255).T
+    
+    # colorsys.rgb_to_hsv, branch by branch
+    maxc = np.maximum(np.maximum(r, g), b)
+    minc = np.minimum(np.minimum(r, g), b)
+    v = maxc
+    rangec = maxc - minc
+    gray = rangec == 0
+    safe_range = np.where(gray, 1.0, rangec)
+    s = np.where(gray, 0.0, rangec / np.where(maxc == 0, 1.0, maxc))
+    rc = (maxc - r) / safe_range
+    gc = (maxc - g) / safe_range
+    bc = (maxc - b) / safe_range
+    h = np.select([r == maxc, g == maxc], [bc - gc, 2.0 + rc - bc], default=4.0 + gc - rc)
+    h = np.where(gray, 0.0, (h / 6.0) % 1.0)
+    
+    h = (h + modifier * intensity * 0.1) % 1.0
+    s = np.clip(s + modifier * intensity * 0.2, 0.0, 1.0)
+    
+    # colorsys.hsv_to_rgb
+    i = np.trunc(h * 6.0)
+    f = (h * 6.0) - i
+    p = v * (1.0 - s)
+    q = v * (1.0 - s * f)
+    t = v * (1.0 - s * (1.0 - f))
+    i = i.astype(np.int64) % 6
+    sector = [i == 0, i == 1, i == 2, i == 3, i == 4]
+    r_new = np.select(sector, [v, q, p, p, t], default=v)
+    g_new = np.select(sector, [t, v, v, q, p], default=p)
+    b_new = np.select(sector, [p, p, t, v, v], default=q)
+    
+    rgb_new = np.stack([r_new, g_new, b_new], axis=1)
+    rgb_new = np.where((s == 0.0)[:, None], v[:, None], rgb_new)
+    return np.trunc(rgb_new * 255).astype(np.uint8)
+
 def get_moon_phase(day_of_year):
     """
     Calculate approximate moon phase for a given day of year.
@@ -197,6 +249,16 @@ def get_moon_phase(day_of_year):
     
     return moon_intensity
 
+@dataclass
+class DayTables:
+    """Per-day values that depend only on day of year, indexed by day_of_year - 1."""
+    moon_phase: np.ndarray
+
+def precompute_day_tables(ndays):
+    """Compute moon phases for days 1..ndays in one pass, with the same formula as get_moon_phase."""
+    day_of_year = np.arange(1, ndays + 1)
+    return DayTables(moon_phase=moon_phase_vec(day_of_year))
+
 def create_palette(palette_type="naturalistic"):
     """Factory function to create color palettes."""
     palettes = {
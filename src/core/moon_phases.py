@@ -5,6 +5,10 @@ Provides precise moon phase calculations and lunar calendar features.
 import math
 from datetime import datetime, timedelta
 
+import numpy as np
+
+from src.core._moon_numba import phase_and_illumination, illumination_array
+
 class MoonPhaseCalculator:
     """Calculate accurate moon phases using astronomical algorithms."""
     
@@ -12,6 +16,10 @@ class MoonPhaseCalculator:
         # Known new moon reference: January 11, 2024, 11:57 UTC
         self.reference_new_moon = datetime(2024, 1, 11, 11, 57)
         self.lunar_cycle_days = 29.530588861  # Precise synodic month length
+        
+        # (phase, illumination) keyed by date; hover panels ask for the same days repeatedly
+        self._phase_cache = {}
+        self._max_phase_cache = 1024
     
     def get_moon_age(self, date):
         """Get moon age in days since last new moon."""
@@ -23,24 +31,47 @@ class MoonPhaseCalculator:
         
         return moon_age
     
+    def get_phase_data(self, date):
+        """Get (phase, illumination) for a date, computed once per date."""
+        cached = self._phase_cache.get(date)
+        if cached is not None:
+            return cached
+        
+        if isinstance(date, str):
+            date_obj = datetime.strptime(date, '%Y-%m-%d')
+        else:
+            date_obj = date
+        days_since_reference = (date_obj - self.reference_new_moon).total_seconds() / 86400
+        
+        # Maximum illumination at phase 0.5 (full moon)
+        cached = phase_and_illumination(days_since_reference, self.lunar_cycle_days)
+        if len(self._phase_cache) >= self._max_phase_cache:
+            # Drop the oldest half; dicts keep insertion order
+            for key in list(self._phase_cache)[:self._max_phase_cache // 2]:
+                del self._phase_cache[key]
+        self._phase_cache[date] = cached
+        return cached
+    
     def get_moon_phase(self, date):
         """Get moon phase as fraction (0=new moon, 0.5=full moon, 1=new moon)."""
-        moon_age = self.get_moon_age(date)
-        phase = moon_age / self.lunar_cycle_days
-        return phase
+        return self.get_phase_data(date)[0]
     
     def get_moon_illumination(self, date):
         """Get moon illumination percentage (0-1)."""
-        phase = self.get_moon_phase(date)
-        # Convert phase to illumination using cosine function
-        # Maximum illumination at phase 0.5 (full moon)
-        illumination = (1 - math.cos(2 * math.pi * phase)) / 2
-        return illumination
+        return self.get_phase_data(date)[1]
+    
+    def get_moon_phases_vec(self, dates):
+        """get_moon_phase and get_moon_illumination for a sequence of 'YYYY-MM-DD' dates.
+        
+        Returns (phase, illumination) float arrays, equal to the scalar results.
+        """
+        seconds = (np.array(dates, dtype='datetime64[s]')
+                   - np.datetime64(self.reference_new_moon, 's')) / np.timedelta64(1, 's')
+        return illumination_array(seconds / 86400, self.lunar_cycle_days)
     
     def get_moon_phase_name(self, date):
         """Get descriptive name of moon phase."""
-        illumination = self.get_moon_illumination(date)
-        phase = self.get_moon_phase(date)
+        phase, illumination = self.get_phase_data(date)
         
         if illumination < 0.05:
             return "New Moon"
@@ -131,6 +162,19 @@ class EnhancedMoonVisualizer:
         
         return (int(r * factor), int(g * factor), int(b * factor))
     
+    def get_moon_colors_by_phase_vec(self, dates):
+        """get_moon_color_by_phase for a sequence of dates; returns an (N, 3) int array."""
+        _, illumination = self.calculator.get_moon_phases_vec(dates)
+        
+        # Same illumination bands as get_moon_phase_name
+        base_colors = np.array([self.moon_colors[name] for name in
+                                ('new', 'crescent', 'quarter', 'gibbous', 'full')], dtype=np.float64)
+        band = np.searchsorted(np.array([0.05, 0.25, 0.75, 0.95]), illumination, side='right')
+        
+        # Apply illumination factor
+        factor = 0.3 + (illumination * 0.7)
+        return np.trunc(base_colors[band] * factor[:, None]).astype(np.int64)
+    
     def create_moon_phase_calendar(self, year=2024):
         """Create a visual calendar showing moon phases."""
         phases = self.calculator.get_major_moon_phases_2024()
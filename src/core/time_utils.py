@@ -3,9 +3,19 @@ Shared utility functions for Time's Pixel visualization project.
 Contains common data processing, time conversion, and helper functions.
 """
 import pandas as pd
+import numpy as np
 import math
+import os
 from datetime import datetime
 
+# Parsed CSVs are cached in binary form under data/.cache; Feather when pyarrow
+# is installed, otherwise pandas pickle
+try:
+    import pyarrow  # noqa: F401
+    DATA_CACHE_SUFFIX = '.feather'
+except ImportError:
+    DATA_CACHE_SUFFIX = '.pkl'
+
 def time_to_hour(t):
     """Convert HH:MM time string to hour as float."""
     if pd.isna(t) or t == '':
@@ -16,6 +26,16 @@ def time_to_hour(t):
     except (ValueError, AttributeError):
         return None
 
+def times_to_hours(values):
+    """Vectorized time_to_hour for a Series of HH:MM strings; missing or invalid entries become NaN."""
+    parts = values.astype(str).str.extract(r'^\s*(\d+)\s*:\s*(\d+)\s*$')
+    hours = pd.to_numeric(parts[0], errors='coerce') + pd.to_numeric(parts[1], errors='coerce') / 60.0
+    return hours.to_numpy(dtype=np.float64)
+
+def nan_to_none(value):
+    """Map a NaN array element back to the None used by the scalar helpers."""
+    return None if value is None or np.isnan(value) else float(value)
+
 def hour_to_time(hour_float):
     """Convert hour float back to HH:MM time string."""
     if hour_float is None:
@@ -32,12 +52,35 @@ def date_to_day_of_year(date_str):
     except ValueError:
         return None
 
+def read_csv_cached(csv_file):
+    """Read a CSV, reusing its binary cache copy when that is at least as new as the CSV."""
+    cache_file = os.path.join(os.path.dirname(csv_file), '.cache', os.path.basename(csv_file) + DATA_CACHE_SUFFIX)
+    
+    try:
+        if os.path.getmtime(cache_file) >= os.path.getmtime(csv_file):
+            if DATA_CACHE_SUFFIX == '.feather':
+                return pd.read_feather(cache_file)
+            return pd.read_pickle(cache_file)
+    except Exception:
+        pass  # No usable cache; parse the CSV below
+    
+    df = pd.read_csv(csv_file)
+    try:
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        if DATA_CACHE_SUFFIX == '.feather':
+            df.to_feather(cache_file)
+        else:
+            df.to_pickle(cache_file)
+    except Exception as e:
+        print(f"Warning: could not write data cache {cache_file}: {e}")
+    return df
+
 def load_astronomical_data(sun_file="data/hongkong_sunrise_sunset_2024_clean.csv", 
                           moon_file="data/moonrise_moonset_2024_clean.csv"):
     """Load and return cleaned astronomical data."""
     try:
-        sun_df = pd.read_csv(sun_file)
-        moon_df = pd.read_csv(moon_file)
+        sun_df = read_csv_cached(sun_file)
+        moon_df = read_csv_cached(moon_file)
         return sun_df, moon_df
     except FileNotFoundError as e:
         print(f"Error loading data files: {e}")
@@ -62,6 +105,40 @@ def get_day_data(sun_df, moon_df, day_index):
         'moon_transit': time_to_hour(moon_row['TRAN.'])
     }
 
+def get_day_arrays(sun_df, moon_df):
+    """Extract per-day columns once as NumPy arrays (structure of arrays).
+    
+    Index i matches get_day_data(sun_df, moon_df, i); missing times are NaN
+    and an unparseable date gives day_of_year 0.
+    """
+    total_days = min(len(sun_df), len(moon_df))
+    sun = sun_df.iloc[:total_days]
+    moon = moon_df.iloc[:total_days]
+    dates = pd.to_datetime(sun['YYYY-MM-DD'], format='%Y-%m-%d', errors='coerce')
+    
+    return {
+        'date': sun['YYYY-MM-DD'].to_numpy(),
+        'day_of_year': dates.dt.dayofyear.fillna(0).to_numpy(dtype=np.int64),
+        'sunrise': times_to_hours(sun['RISE']),
+        'sunset': times_to_hours(sun['SET']),
+        'sun_transit': times_to_hours(sun['TRAN.']),
+        'moonrise': times_to_hours(moon['RISE']),
+        'moonset': times_to_hours(moon['SET']),
+        'moon_transit': times_to_hours(moon['TRAN.'])
+    }
+
+def day_arrays_to_records(days):
+    """Per-day dicts equal to get_day_data, built from get_day_arrays output without touching pandas."""
+    time_keys = ('sunrise', 'sunset', 'sun_transit', 'moonrise', 'moonset', 'moon_transit')
+    times = {key: [nan_to_none(value) for value in days[key].tolist()] for key in time_keys}
+    
+    records = []
+    for i, (date_str, day_of_year) in enumerate(zip(days['date'].tolist(), days['day_of_year'].tolist())):
+        record = {'date': date_str, 'day_of_year': day_of_year or None}
+        record.update((key, times[key][i]) for key in time_keys)
+        records.append(record)
+    return records
+
 def calculate_daylight_duration(sunrise, sunset):
     """Calculate daylight duration in hours."""
     if sunrise is None or sunset is None:
@@ -124,8 +201,11 @@ def overlay_color(base_color, overlay_color, opacity=0.5):
     
     return (r, g, b)
 
-def generate_hour_pixels(day_data, palette, img_width=24):
-    """Generate pixel colors for all hours of a day."""
+def generate_hour_pixels(day_data, palette, img_width=24, tables=None):
+    """Generate pixel colors for all hours of a day.
+    
+    If precomputed DayTables are given, the moon phase is looked up instead of recomputed.
+    """
     if day_data is None:
         return [(30, 30, 60)] * img_width  # Default night color
     
@@ -136,9 +216,12 @@ def generate_hour_pixels(day_data, palette, img_width=24):
     moonrise = day_data['moonrise']
     moonset = day_data['moonset']
     
-    # Import here to avoid circular import
-    from src.core.color_palettes import get_moon_phase
-    moon_phase = get_moon_phase(day_of_year) if day_of_year else 0.5
+    if tables is not None and day_of_year:
+        moon_phase = tables.moon_phase[day_of_year - 1]
+    else:
+        # Import here to avoid circular import
+        from src.core.color_palettes import get_moon_phase
+        moon_phase = get_moon_phase(day_of_year) if day_of_year else 0.5
     
     for hour in range(img_width):
         # Get base sky color with twilight transitions
@@ -157,6 +240,35 @@ def generate_hour_pixels(day_data, palette, img_width=24):
     
     return pixels
 
+def generate_hour_pixels_batch(days, palettes, img_width=24, tables=None):
+    """generate_hour_pixels for every palette and every day in one compiled pass.
+    
+    days holds per-day arrays in get_day_arrays form; returns a
+    (len(palettes), days, img_width, 3) uint8 array. If precomputed DayTables
+    are given, moon phases are looked up instead of recomputed.
+    """
+    # Import here to avoid circular import
+    from src.core.color_palettes import get_moon_phase
+    from src.core._palette_numba import hour_pixels_batch
+    
+    day_of_year = np.asarray(days['day_of_year'], dtype=np.int64)
+    if tables is not None:
+        moon_phase = np.where(day_of_year > 0, tables.moon_phase[np.maximum(day_of_year, 1) - 1], 0.5)
+    else:
+        moon_phase = np.array([get_moon_phase(doy) if doy else 0.5 for doy in day_of_year.tolist()])
+    
+    color_arrays = [palette._color_arrays() for palette in palettes]
+    out = np.empty((len(palettes), len(day_of_year), img_width, 3), dtype=np.uint8)
+    hour_pixels_batch(
+        np.asarray(days['sunrise'], dtype=np.float64), np.asarray(days['sunset'], dtype=np.float64),
+        np.asarray(days['moonrise'], dtype=np.float64), np.asarray(days['moonset'], dtype=np.float64),
+        np.maximum(day_of_year, 1), moon_phase.astype(np.float64),
+        np.stack([colors for colors, _ in color_arrays]),
+        np.stack([colors_hsv for _, colors_hsv in color_arrays]),
+        out
+    )
+    return out
+
 def calculate_seasonal_stats(sun_df):
     """Calculate seasonal statistics from sun data."""
     stats = {
@@ -3,8 +3,24 @@ Advanced Twilight Gradient System for Time's Pixel
 Implements civil, nautical, and astronomical twilight calculations for realistic sky transitions.
 """
 import math
+import numpy as np
 from datetime import datetime, timedelta
 
+from src.core._sky_numba import render_year
+
+# Sky types in the order used by the vectorized helpers (index = type code)
+SKY_TYPES = (
+    'night',
+    'astronomical_twilight',
+    'nautical_twilight',
+    'civil_twilight_morning',
+    'civil_twilight_evening',
+    'blue_hour_morning',
+    'blue_hour_evening',
+    'golden_hour',
+    'day'
+)
+
 class TwilightCalculator:
     """Calculate different types of twilight based on solar elevation angles."""
     
@@ -20,6 +36,9 @@ class TwilightCalculator:
             'blue_hour': 4,   # Blue hour: sun 4° below horizon
             'golden_hour': -6  # Golden hour: sun above horizon to 6° elevation
         }
+        
+        # Twilight times keyed by (date, sunrise, sunset)
+        self._twilight_cache = {}
     
     def get_day_of_year(self, date_str):
         """Convert date string to day of year."""
@@ -54,6 +73,10 @@ class TwilightCalculator:
         if sunrise_hour is None or sunset_hour is None:
             return {}
         
+        cache_key = (date_str, round(sunrise_hour, 4), round(sunset_hour, 4))
+        if cache_key in self._twilight_cache:
+            return self._twilight_cache[cache_key]
+        
         day_of_year = self.get_day_of_year(date_str)
         declination = self.calculate_solar_declination(day_of_year)
         
@@ -81,6 +104,7 @@ class TwilightCalculator:
                     'evening': evening_time
                 }
         
+        self._twilight_cache[cache_key] = twilight_times
         return twilight_times
     
     def get_sky_type(self, time_hour, sunrise_hour, sunset_hour, twilight_times):
@@ -129,6 +153,57 @@ class TwilightCalculator:
             else:
                 return 'night'
 
+    def get_sky_types_vec(self, time_hours, sunrise_hour, sunset_hour, twilight_times):
+        """Vectorized get_sky_type over an array of hours; returns indices into SKY_TYPES."""
+        hours = np.asarray(time_hours, dtype=np.float64)
+        codes = np.zeros(hours.shape, dtype=np.int8)
+        if sunrise_hour is None or sunset_hour is None:
+            return codes
+        
+        def bound(phase, key):
+            return twilight_times.get(phase, {}).get(key)
+        
+        def at_or_after(phase):
+            t = bound(phase, 'morning')
+            return hours >= t if t is not None else np.zeros(hours.shape, dtype=bool)
+        
+        def at_or_before(phase):
+            t = bound(phase, 'evening')
+            return hours <= t if t is not None else np.zeros(hours.shape, dtype=bool)
+        
+        code = SKY_TYPES.index
+        is_day = (sunrise_hour <= hours) & (hours <= sunset_hour)
+        is_morning = ~is_day & (hours < sunrise_hour)
+        is_evening = ~is_day & ~is_morning
+        
+        golden_morning = bound('golden_hour', 'morning')
+        golden_evening = bound('golden_hour', 'evening')
+        is_golden = np.zeros(hours.shape, dtype=bool)
+        if golden_morning is not None:
+            is_golden |= hours <= golden_morning
+        if golden_evening is not None:
+            is_golden |= hours >= golden_evening
+        
+        morning_types = np.select(
+            [at_or_after('blue_hour'), at_or_after('civil'),
+             at_or_after('nautical'), at_or_after('astronomical')],
+            [code('blue_hour_morning'), code('civil_twilight_morning'),
+             code('nautical_twilight'), code('astronomical_twilight')],
+            default=code('night')
+        )
+        evening_types = np.select(
+            [at_or_before('blue_hour'), at_or_before('civil'),
+             at_or_before('nautical'), at_or_before('astronomical')],
+            [code('blue_hour_evening'), code('civil_twilight_evening'),
+             code('nautical_twilight'), code('astronomical_twilight')],
+            default=code('night')
+        )
+        
+        codes[is_day] = np.where(is_golden, code('golden_hour'), code('day'))[is_day]
+        codes[is_morning] = morning_types[is_morning]
+        codes[is_evening] = evening_types[is_evening]
+        return codes
+
 class AdvancedSkyPalette:
     """Advanced color palette with realistic twilight transitions."""
     
@@ -162,9 +237,31 @@ class AdvancedSkyPalette:
             'golden_hour': 1.0,
             'day': 1.0
         }
+        
+        # Memoized get_advanced_sky_color results; interactive and animated views
+        # ask for the same hour of the same day over and over
+        self._sky_color_cache = {}
+        self._max_sky_color_cache = 4096
     
     def get_advanced_sky_color(self, time_hour, sunrise_hour, sunset_hour, date_str, day_of_year):
         """Get sky color with advanced twilight calculations."""
+        cache_key = (time_hour, sunrise_hour, sunset_hour, date_str, day_of_year)
+        if cache_key in self._sky_color_cache:
+            return self._sky_color_cache[cache_key]
+        
+        color = self._compute_advanced_sky_color(
+            time_hour, sunrise_hour, sunset_hour, date_str, day_of_year
+        )
+        
+        # Drop the oldest half when full so long animations stay bounded
+        if len(self._sky_color_cache) >= self._max_sky_color_cache:
+            for key in list(self._sky_color_cache)[:self._max_sky_color_cache // 2]:
+                del self._sky_color_cache[key]
+        self._sky_color_cache[cache_key] = color
+        return color
+    
+    def _compute_advanced_sky_color(self, time_hour, sunrise_hour, sunset_hour, date_str, day_of_year):
+        """Uncached body of get_advanced_sky_color."""
         # Calculate twilight times
         twilight_times = self.twilight_calculator.calculate_twilight_times(
             date_str, sunrise_hour, sunset_hour
@@ -187,6 +284,95 @@ class AdvancedSkyPalette:
             time_hour, sky_type, base_color, sunrise_hour, sunset_hour, twilight_times
         )
     
+    def get_advanced_sky_colors_vec(self, time_hours, sunrise_hour, sunset_hour, date_str, day_of_year):
+        """Vectorized get_advanced_sky_color over an array of hours; returns an (N, 3) uint8 array."""
+        hours = np.asarray(time_hours, dtype=np.float64)
+        twilight_times = self.twilight_calculator.calculate_twilight_times(
+            date_str, sunrise_hour, sunset_hour
+        )
+        sky_codes = self.twilight_calculator.get_sky_types_vec(
+            hours, sunrise_hour, sunset_hour, twilight_times
+        )
+        
+        # Tint each sky type once instead of once per hour
+        type_colors = [self.sky_colors[sky_type] for sky_type in SKY_TYPES]
+        if day_of_year:
+            type_colors = [self.apply_seasonal_tint(color, day_of_year) for color in type_colors]
+        base = np.array(type_colors, dtype=np.float64)[sky_codes]
+        
+        return self.smooth_transitions_vec(hours, base, sunrise_hour, sunset_hour).astype(np.uint8)
+    
+    def render_sky_year(self, sunrise, sunset, day_of_year, moonrise, moonset, moon_color, opacity,
+                        hours_per_day=24, return_sky_types=False):
+        """Sky colors with the moon overlay for many days in one compiled pass.
+        
+        Per-day inputs are (D,) arrays with NaN for missing times (moon_color is
+        (D, 3)); day_of_year drives both twilight times and seasonal tint. Hours
+        are 0..hours_per_day-1, moon hours wrap past midnight, and opacity is the
+        overlay weight in [0, 1], applied in Q8 fixed point. Returns a
+        (D, hours_per_day, 3) uint8 array equal to get_advanced_sky_color with
+        the moon blended in; with return_sky_types a (D, hours_per_day) int8
+        array of SKY_TYPES codes is returned as well.
+        """
+        calculator = self.twilight_calculator
+        out = np.empty((len(sunrise), hours_per_day, 3), dtype=np.uint8)
+        sky_types = np.empty((len(sunrise), hours_per_day), dtype=np.int8)
+        render_year(
+            np.asarray(sunrise, dtype=np.float64), np.asarray(sunset, dtype=np.float64),
+            np.asarray(moonrise, dtype=np.float64), np.asarray(moonset, dtype=np.float64),
+            np.asarray(day_of_year, dtype=np.int64),
+            np.asarray(moon_color, dtype=np.int64),
+            np.clip(np.round(np.asarray(opacity, dtype=np.float64) * 256), 0, 256).astype(np.int64),
+            np.array([self.sky_colors[sky_type] for sky_type in SKY_TYPES], dtype=np.int64),
+            np.array([self.sky_colors[name] for name in ('sunrise', 'day', 'sunset')], dtype=np.float64),
+            calculator.latitude,
+            np.array(list(calculator.twilight_angles.values()), dtype=np.float64),
+            out, sky_types
+        )
+        if return_sky_types:
+            return out, sky_types
+        return out
+    
+    def smooth_transitions_vec(self, hours, base, sunrise_hour, sunset_hour):
+        """Vectorized smooth_transitions over an array of hours and (N, 3) base colors."""
+        transition_width = 0.5
+        result = base.copy()
+        handled = np.zeros(hours.shape, dtype=bool)
+        
+        if sunrise_hour:
+            near = np.abs(hours - sunrise_hour) <= transition_width
+            pre = near & (hours < sunrise_hour)
+            post = near & ~pre
+            sunrise_color = np.array(self.sky_colors['sunrise'], dtype=np.float64)
+            day_color = np.array(self.sky_colors['day'], dtype=np.float64)
+            result[pre] = self.blend_colors_vec(
+                sunrise_color, base[pre], (sunrise_hour - hours[pre]) / transition_width
+            )
+            result[post] = self.blend_colors_vec(
+                base[post], day_color, (hours[post] - sunrise_hour) / transition_width
+            )
+            handled |= near
+        
+        if sunset_hour:
+            near = ~handled & (np.abs(hours - sunset_hour) <= transition_width)
+            pre = near & (hours < sunset_hour)
+            post = near & ~pre
+            day_color = np.array(self.sky_colors['day'], dtype=np.float64)
+            sunset_color = np.array(self.sky_colors['sunset'], dtype=np.float64)
+            result[pre] = self.blend_colors_vec(
+                day_color, sunset_color, 1 - (sunset_hour - hours[pre]) / transition_width
+            )
+            result[post] = self.blend_colors_vec(
+                sunset_color, base[post], (hours[post] - sunset_hour) / transition_width
+            )
+        
+        return result
+    
+    def blend_colors_vec(self, color1, color2, factor):
+        """Vectorized blend_colors; colors broadcast against an (N,) factor array."""
+        factor = np.clip(factor, 0, 1)[:, None]
+        return np.trunc(color1 + (color2 - color1) * factor)
+    
     def smooth_transitions(self, time_hour, sky_type, base_color, sunrise_hour, sunset_hour, twilight_times):
         """Apply smooth color transitions between twilight phases."""
         transition_width = 0.5  # Hours for transition smoothing
@@ -0,0 +1,64 @@
+"""
+JIT-compiled moon visibility kernels for whole-year sweeps.
+Times are decimal hours; a moonrise later than the moonset means the moon
+sets the next day. Missing (NaN) times are never visible.
+"""
+import numpy as np
+
+from src.core._numba_compat import njit, prange
+
+@njit(cache=True)
+def moon_visibility(current_hour, moonrise, moonset):
+    """Return (visible, progress) for one hour; progress is NaN when not visible."""
+    # The span modulo 24 covers same-day and cross-day moons with one formula;
+    # equal rise and set times mean a full 24-hour span
+    duration = (moonset - moonrise) % 24.0
+    if duration == 0.0:
+        duration = 24.0
+    time_since_rise = current_hour - moonrise
+    if time_since_rise >= 0.0 and time_since_rise <= duration:
+        return True, time_since_rise / duration
+    return False, np.nan
+
+@njit(cache=True, parallel=True)
+def visibility_batch(hours, rise, set_):
+    """moon_visibility over equal-length 1-D float64 arrays.
+
+    Returns (visible, progress) arrays; progress is NaN where the moon is not visible.
+    """
+    n = len(hours)
+    visible = np.zeros(n, dtype=np.bool_)
+    progress = np.empty(n, dtype=np.float64)
+    for i in prange(n):
+        visible[i], progress[i] = moon_visibility(hours[i], rise[i], set_[i])
+    return visible, progress
+
+def moon_visibility_vec(hours, moonrise, moonset):
+    """visibility_batch for any inputs that broadcast together; keeps the broadcast shape."""
+    hours, moonrise, moonset = np.broadcast_arrays(
+        np.asarray(hours, dtype=np.float64),
+        np.asarray(moonrise, dtype=np.float64),
+        np.asarray(moonset, dtype=np.float64),
+    )
+    visible, progress = visibility_batch(
+        np.ascontiguousarray(hours).ravel(),
+        np.ascontiguousarray(moonrise).ravel(),
+        np.ascontiguousarray(moonset).ravel(),
+    )
+    return visible.reshape(hours.shape), progress.reshape(hours.shape)
+
+def make_visibility(moonrise, moonset):
+    """Build a moon_visibility for one day with its rise and set times baked in.
+
+    The returned f(current_hour) gives the same (visible, progress) pair as
+    moon_visibility, with the span computed once instead of on every call.
+    """
+    duration = (moonset - moonrise) % 24.0 or 24.0
+
+    def visibility(current_hour):
+        time_since_rise = current_hour - moonrise
+        if 0.0 <= time_since_rise <= duration:
+            return True, time_since_rise / duration
+        return False, np.nan
+
+    return visibility
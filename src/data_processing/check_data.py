@@ -17,6 +17,14 @@ def minutes_to_time(m):
     m = int(m % 60)
     return f"{h:02d}:{m:02d}"
 
+# HH:MM with optional surrounding whitespace, captured as (hours, minutes)
+TIME_PATTERN = r'^\s*(\d+)\s*:\s*(\d+)\s*$'
+
+def split_time(values):
+    """Split a Series of HH:MM strings into numeric (hours, minutes) Series; invalid entries become NaN."""
+    parts = values.astype(str).str.extract(TIME_PATTERN)
+    return pd.to_numeric(parts[0], errors='coerce'), pd.to_numeric(parts[1], errors='coerce')
+
 def clean_and_save(file_path, label, output_path=None):
     """Clean CSV data by preserving NaN values for missing astronomical events.
     
@@ -44,25 +52,10 @@ def clean_and_save(file_path, label, output_path=None):
         # Track originally missing values (these should stay missing)
         originally_missing = df[col].isna() | (df[col] == '') | (df[col].astype(str) == 'nan')
         
-        # For non-missing values, validate time format
-        for idx in df.index:
-            if not originally_missing.iloc[idx]:
-                time_val = df.at[idx, col]
-                try:
-                    # Validate time format
-                    if pd.notna(time_val) and time_val != '':
-                        parts = str(time_val).split(':')
-                        if len(parts) == 2:
-                            hours, minutes = int(parts[0]), int(parts[1])
-                            if not (0 <= hours <= 23 and 0 <= minutes <= 59):
-                                # Invalid time, mark as missing
-                                df_clean.at[idx, col] = None
-                        else:
-                            # Invalid format, mark as missing
-                            df_clean.at[idx, col] = None
-                except (ValueError, AttributeError):
-                    # Conversion error, mark as missing
-                    df_clean.at[idx, col] = None
+        # For non-missing values, validate time format (HH:MM within 00:00-23:59)
+        hours, minutes = split_time(df[col])
+        valid = hours.between(0, 23) & minutes.between(0, 59)
+        df_clean.loc[~originally_missing & ~valid, col] = None
         
         # Ensure originally missing values remain missing
         df_clean.loc[originally_missing, col] = None
@@ -1,5 +1,8 @@
 import requests
 import os
+import shutil
+import tempfile
+from email.utils import formatdate
 
 SUN_URL = "https://data.weather.gov.hk/weatherAPI/opendata/opendata.php?dataType=SRS&year=2024&rformat=csv"
 SUN_FILE = "hongkong_sunrise_sunset_2024.csv"
@@ -8,21 +11,39 @@ SUN_FILE = "hongkong_sunrise_sunset_2024.csv"
 MOON_URL = "https://data.weather.gov.hk/weatherAPI/opendata/opendata.php?dataType=MRS&year=2024&rformat=csv"
 MOON_FILE = "moonrise_moonset_2024.csv"
 
-# Download the CSV file
+# Download the CSV file, streaming the body straight to disk
 def download_data(url, filename):
-    response = requests.get(url)
-    response.raise_for_status()
-    with open(filename, "wb") as f:
-        f.write(response.content)
+    headers = {}
+    if os.path.exists(filename):
+        # Let the server answer 304 when our copy is already current
+        headers["If-Modified-Since"] = formatdate(os.path.getmtime(filename), usegmt=True)
+    
+    with requests.get(url, headers=headers, stream=True) as response:
+        if response.status_code == 304:
+            print(f"{filename} is up to date, skipping download")
+            return
+        response.raise_for_status()
+        response.raw.decode_content = True  # undo gzip/deflate transfer encoding
+        # Stream into a temp file beside the target and swap it in only once
+        # complete, so an interrupted download never leaves a truncated CSV
+        # whose fresh mtime would make the server answer 304 next time
+        tmp = tempfile.NamedTemporaryFile(dir=os.path.dirname(filename) or '.', delete=False)
+        try:
+            with tmp:
+                shutil.copyfileobj(response.raw, tmp, length=1 << 16)
+            # Temp files are created owner-only; give the CSV the usual permissions
+            umask = os.umask(0)
+            os.umask(umask)
+            os.chmod(tmp.name, 0o666 & ~umask)
+            os.replace(tmp.name, filename)
+        except BaseException:
+            os.unlink(tmp.name)
+            raise
     print(f"Data downloaded and saved as {filename}")
     
 # Download moonrise/moonset CSV file
 def download_moon_data():
-    response = requests.get(MOON_URL)
-    response.raise_for_status()
-    with open(MOON_FILE, "wb") as f:
-        f.write(response.content)
-    print(f"Moonrise/moonset data downloaded and saved as {MOON_FILE}")
+    download_data(MOON_URL, MOON_FILE)
 
 if __name__ == "__main__":
     download_data(SUN_URL, SUN_FILE)
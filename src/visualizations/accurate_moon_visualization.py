@@ -3,6 +3,7 @@ Enhanced Time's Pixel Visualization with Accurate Moon Phases
 Uses precise astronomical calculations for moon phases and improved color rendering.
 """
 import pandas as pd
+import numpy as np
 from PIL import Image
 import sys
 import os
@@ -12,6 +13,7 @@ try:
     from src.core.color_palettes import create_palette
     from src.core.time_utils import load_astronomical_data, get_day_data
     from src.core.moon_phases import MoonPhaseCalculator, EnhancedMoonVisualizer
+    from src.core._pixel_numba import opacity_to_q8, overlay_rgb
 except ImportError as e:
     print(f"Error importing modules: {e}")
     sys.exit(1)
@@ -59,7 +61,7 @@ def generate_accurate_hour_pixels(day_data, palette, moon_calculator, moon_visua
             
             # Blend moon color with sky color based on illumination
             opacity = 0.2 + (moon_illumination * 0.5)  # 20% to 70% opacity based on phase
-            final_color = overlay_color_with_opacity(base_color, moon_color, opacity)
+            final_color = overlay_rgb(tuple(base_color), tuple(moon_color), opacity_to_q8(opacity))
         else:
             final_color = base_color
         
@@ -67,18 +69,6 @@ def generate_accurate_hour_pixels(day_data, palette, moon_calculator, moon_visua
     
     return pixels
 
-def overlay_color_with_opacity(base_color, overlay_color, opacity):
-    """Overlay one color on another with specified opacity."""
-    opacity = max(0, min(1, opacity))
-    r_base, g_base, b_base = base_color
-    r_over, g_over, b_over = overlay_color
-    
-    r = int(r_base * (1 - opacity) + r_over * opacity)
-    g = int(g_base * (1 - opacity) + g_over * opacity)
-    b = int(b_base * (1 - opacity) + b_over * opacity)
-    
-    return (r, g, b)
-
 def create_moon_phase_visualization():
     """Create visualization showing moon phases throughout the year."""
     print("Creating accurate moon phase visualization...")
@@ -97,8 +87,8 @@ def create_moon_phase_visualization():
     palette = create_palette(PALETTE_TYPE)
     
     # Generate pixels with accurate moon phases
-    all_pixels = []
     total_days = min(len(sun_df), len(moon_df))
+    all_pixels = np.empty((total_days, IMG_WIDTH, 3), dtype=np.uint8)
     
     moon_phase_info = []  # Store moon phase data for analysis
     
@@ -117,17 +107,13 @@ def create_moon_phase_visualization():
             })
         
         # Generate enhanced pixels
-        hour_pixels = generate_accurate_hour_pixels(day_data, palette, moon_calculator, moon_visualizer)
-        all_pixels.append(hour_pixels)
+        all_pixels[day_idx] = generate_accurate_hour_pixels(day_data, palette, moon_calculator, moon_visualizer)
         
         if (day_idx + 1) % 50 == 0:
             print(f"Processed {day_idx + 1}/{total_days} days...")
     
     # Create main visualization
-    img_height = len(all_pixels)
-    img = Image.new('RGB', (IMG_WIDTH, img_height))
-    pixels_flat = [pixel for row in all_pixels for pixel in row]
-    img.putdata(pixels_flat)
+    img = Image.fromarray(all_pixels, 'RGB')
     img.save(OUTPUT_FILE)
     
     print(f"Accurate moon phase visualization saved as {OUTPUT_FILE}")
@@ -145,30 +131,16 @@ def create_moon_phase_strip(moon_phase_info, moon_visualizer):
     strip_width = len(moon_phase_info)
     strip_height = 50
     
-    # Create image for moon phase strip
-    phase_img = Image.new('RGB', (strip_width, strip_height))
-    
-    phase_pixels = []
-    for info in moon_phase_info:
-        date = info['date']
-        illumination = info['illumination']
-        
-        # Get moon color based on phase
-        moon_color = moon_visualizer.get_moon_color_by_phase(date)
-        
-        # Create gradient from black to moon color based on illumination
-        for y in range(strip_height):
-            gradient_factor = y / strip_height
-            if gradient_factor <= illumination:
-                # Illuminated part
-                pixel_color = moon_color
-            else:
-                # Dark part
-                pixel_color = (20, 20, 30)
-            
-            phase_pixels.append(pixel_color)
+    # Each day is a run of strip_height pixels, lit where y / strip_height is within
+    # its illumination; the runs fill the image in row-major order
+    illuminations = np.array([info['illumination'] for info in moon_phase_info])[:, None]
+    moon_colors = np.array([moon_visualizer.get_moon_color_by_phase(info['date']) for info in moon_phase_info],
+                           dtype=np.uint8)[:, None, :]
+    gradient_factors = (np.arange(strip_height) / strip_height)[None, :]
+    phase_pixels = np.where((gradient_factors <= illuminations)[:, :, None],
+                            moon_colors, np.array([20, 20, 30], dtype=np.uint8))
     
-    phase_img.putdata(phase_pixels)
+    phase_img = Image.fromarray(phase_pixels.reshape(strip_height, strip_width, 3), 'RGB')
     phase_img.save("moon_phase_strip.png")
     print("Moon phase strip saved as moon_phase_strip.png")
 
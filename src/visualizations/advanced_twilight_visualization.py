@@ -3,14 +3,19 @@ Advanced Twilight Visualization for Time's Pixel
 Creates stunning visualizations with realistic civil, nautical, and astronomical twilight.
 """
 import pandas as pd
+import numpy as np
 from PIL import Image
+from contextlib import nullcontext
+from multiprocessing import Pool
+import os
 import sys
 
 # Import our advanced modules
 try:
     from src.core.twilight_calculator import AdvancedSkyPalette, TwilightCalculator
-    from src.core.time_utils import load_astronomical_data, get_day_data
+    from src.core.time_utils import load_astronomical_data, get_day_data, get_day_arrays, nan_to_none
     from src.core.moon_phases import MoonPhaseCalculator, EnhancedMoonVisualizer
+    from src.core._pixel_numba import opacity_to_q8, overlay_array
 except ImportError as e:
     print(f"Error importing modules: {e}")
     sys.exit(1)
@@ -19,148 +24,178 @@ except ImportError as e:
 IMG_WIDTH = 24  # hours in a day
 OUTPUT_FILE = "advanced_twilight_visualization.png"
 COMPARISON_FILE = "twilight_comparison.png"
+POOL_CHUNKSIZE = 16  # days per task sent to each worker process
+
+# Statistic name -> (twilight type, minimum duration in hours to count the day)
+TWILIGHT_STAT_THRESHOLDS = {
+    'golden_hours': ('golden_hour', 2),
+    'blue_hours': ('blue_hour', 1),
+    'civil_twilight': ('civil', 13),
+    'nautical_twilight': ('nautical', 14),
+    'astronomical_twilight': ('astronomical', 15)
+}
+
+# Per-process rendering helpers, created once by _init_render_worker
+_worker_state = {}
 
 def generate_advanced_twilight_pixels(day_data, sky_palette, moon_calculator, moon_visualizer):
-    """Generate pixels using advanced twilight calculations."""
+    """Generate pixels using advanced twilight calculations.
+    
+    Returns an (IMG_WIDTH, 3) uint8 array with one RGB row per hour.
+    """
     if day_data is None:
-        return [(15, 15, 35)] * IMG_WIDTH
-    
-    pixels = []
-    date_str = day_data['date']
-    day_of_year = day_data['day_of_year']
-    sunrise = day_data['sunrise']
-    sunset = day_data['sunset']
-    moonrise = day_data['moonrise']
-    moonset = day_data['moonset']
-    
-    # Get moon phase data
-    moon_illumination = moon_calculator.get_moon_illumination(date_str) if date_str else 0.5
-    
-    for hour in range(IMG_WIDTH):
-        # Get advanced sky color with proper twilight calculations
-        sky_color = sky_palette.get_advanced_sky_color(
-            hour, sunrise, sunset, date_str or "2024-01-01", day_of_year or 1
-        )
-        
-        # Check if moon is up
-        moon_up = False
-        if moonrise is not None and moonset is not None:
-            if moonrise < moonset:
-                moon_up = moonrise <= hour < moonset
-            else:
-                moon_up = hour >= moonrise or hour < moonset
-        
-        if moon_up and date_str:
-            # Get moon color based on phase
-            moon_color = moon_visualizer.get_moon_color_by_phase(date_str)
-            
-            # Blend moon with sky based on illumination
-            opacity = 0.1 + (moon_illumination * 0.4)  # 10% to 50% opacity
-            final_color = overlay_color_with_opacity(sky_color, moon_color, opacity)
-        else:
-            final_color = sky_color
-        
-        pixels.append(final_color)
+        return np.full((IMG_WIDTH, 3), (15, 15, 35), dtype=np.uint8)
     
-    return pixels
+    return generate_advanced_twilight_pixels_np(
+        day_data['date'], day_data['day_of_year'],
+        day_data['sunrise'], day_data['sunset'],
+        day_data['moonrise'], day_data['moonset'],
+        sky_palette, moon_calculator, moon_visualizer
+    )
 
-def overlay_color_with_opacity(base_color, overlay_color, opacity):
-    """Overlay one color on another with specified opacity."""
-    opacity = max(0, min(1, opacity))
-    r_base, g_base, b_base = base_color
-    r_over, g_over, b_over = overlay_color
+def generate_advanced_twilight_pixels_np(date_str, day_of_year, sunrise, sunset, moonrise, moonset,
+                                         sky_palette, moon_calculator, moon_visualizer):
+    """Generate one day's (IMG_WIDTH, 3) uint8 pixel row from scalar day values.
     
-    r = int(r_base * (1 - opacity) + r_over * opacity)
-    g = int(g_base * (1 - opacity) + g_over * opacity)
-    b = int(b_base * (1 - opacity) + b_over * opacity)
+    Times may be None or NaN when the event does not happen that day.
+    """
+    sunrise, sunset = nan_to_none(sunrise), nan_to_none(sunset)
+    moonrise, moonset = nan_to_none(moonrise), nan_to_none(moonset)
+    
+    hours = np.arange(IMG_WIDTH)
+    
+    # Get advanced sky colors for the whole day in one batched call
+    sky = sky_palette.get_advanced_sky_colors_vec(
+        hours, sunrise, sunset, date_str or "2024-01-01", day_of_year or 1
+    )
     
-    return (r, g, b)
+    if moonrise is None or moonset is None or not date_str:
+        return sky
+    
+    # Moon-up mask without a same-day/next-day branch: measure hours since
+    # moonrise modulo 24 and compare with the visible duration. Equal rise and
+    # set times count as up all day, matching the wrap-around case.
+    duration = (moonset - moonrise) % 24 or 24.0
+    moon_up = (hours - moonrise) % 24 < duration
+    
+    # Blend moon with sky based on illumination (10% to 50% opacity), in Q8
+    # fixed point; hours without the moon get a zero weight and keep the sky color
+    moon_illumination = moon_calculator.get_moon_illumination(date_str)
+    moon_color = np.array(moon_visualizer.get_moon_color_by_phase(date_str), dtype=np.int64)
+    op8 = opacity_to_q8(0.1 + (moon_illumination * 0.4))
+    op8s = np.where(moon_up, op8, 0).astype(np.int64)
+    
+    return overlay_array(sky.astype(np.int64), moon_color, op8s)
+
+def _init_render_worker():
+    """Pool initializer: build the palette and moon helpers once per worker."""
+    _worker_state['sky_palette'] = AdvancedSkyPalette()
+    _worker_state['moon_calculator'] = MoonPhaseCalculator()
+    _worker_state['moon_visualizer'] = EnhancedMoonVisualizer()
+
+def _render_day(day_values):
+    """Pool worker: render one day's pixel row from a (date, day_of_year, sunrise,
+    sunset, moonrise, moonset) tuple with this process's helpers.
+    
+    Returns (row, twilight_times); twilight_times is None when the day has no
+    date, sunrise or sunset and should be left out of the statistics.
+    """
+    sky_palette = _worker_state['sky_palette']
+    row = generate_advanced_twilight_pixels_np(
+        *day_values,
+        sky_palette,
+        _worker_state['moon_calculator'],
+        _worker_state['moon_visualizer']
+    )
+    
+    date_str, _, sunrise, sunset = day_values[:4]
+    sunrise, sunset = nan_to_none(sunrise), nan_to_none(sunset)
+    twilight_times = None
+    if all([date_str, sunrise, sunset]):
+        # Already computed for the row above, so this is a cache hit
+        twilight_times = sky_palette.twilight_calculator.calculate_twilight_times(
+            date_str, sunrise, sunset
+        )
+    return row, twilight_times
 
-def create_advanced_twilight_visualization():
-    """Create visualization with advanced twilight calculations."""
+def create_advanced_twilight_visualization(sun_df=None, moon_df=None, processes=None):
+    """Create visualization with advanced twilight calculations.
+    
+    Data is loaded from disk unless already-loaded frames are passed in.
+    Days are rendered in parallel across `processes` workers (default: all CPUs),
+    or in-process when only one worker is available.
+    """
     print("🌅 CREATING ADVANCED TWILIGHT VISUALIZATION")
     print("="*60)
     
-    # Initialize advanced systems
-    sky_palette = AdvancedSkyPalette()
-    moon_calculator = MoonPhaseCalculator()
-    moon_visualizer = EnhancedMoonVisualizer()
-    
     # Load data
-    sun_df, moon_df = load_astronomical_data()
+    if sun_df is None or moon_df is None:
+        sun_df, moon_df = load_astronomical_data()
     if sun_df is None or moon_df is None:
         print("Failed to load data files.")
         return
     
     # Generate pixels with advanced twilight
     print("Generating advanced twilight pixels...")
-    all_pixels = []
-    total_days = min(len(sun_df), len(moon_df))
-    
-    twilight_stats = {
-        'golden_hours': 0,
-        'blue_hours': 0,
-        'civil_twilight': 0,
-        'nautical_twilight': 0,
-        'astronomical_twilight': 0
+    days = get_day_arrays(sun_df, moon_df)
+    total_days = len(days['date'])
+    buf = np.empty((total_days, IMG_WIDTH, 3), dtype=np.uint8)
+    
+    # Per-day twilight durations by type, counted after the loop
+    durations = {
+        twilight_type: np.full(total_days, np.nan)
+        for twilight_type, _ in TWILIGHT_STAT_THRESHOLDS.values()
     }
     
-    for day_idx in range(total_days):
-        day_data = get_day_data(sun_df, moon_df, day_idx)
-        
-        # Generate advanced pixels
-        hour_pixels = generate_advanced_twilight_pixels(
-            day_data, sky_palette, moon_calculator, moon_visualizer
-        )
-        all_pixels.append(hour_pixels)
-        
-        # Collect twilight statistics
-        if day_data and day_data['date']:
-            collect_twilight_stats(day_data, sky_palette, twilight_stats)
-        
-        if (day_idx + 1) % 50 == 0:
-            print(f"Processed {day_idx + 1}/{total_days} days...")
+    day_values = zip(
+        days['date'], days['day_of_year'], days['sunrise'],
+        days['sunset'], days['moonrise'], days['moonset']
+    )
+    
+    # Days are independent, so render them in parallel straight into the image buffer;
+    # with a single worker a pool only adds start-up cost, so render in-process
+    parallel = (processes or os.cpu_count() or 1) > 1
+    if not parallel:
+        _init_render_worker()
+    with Pool(processes, initializer=_init_render_worker) if parallel else nullcontext() as pool:
+        if parallel:
+            rows = pool.imap(_render_day, day_values, chunksize=POOL_CHUNKSIZE)
+        else:
+            rows = map(_render_day, day_values)
+        for day_idx, (row, twilight_times) in enumerate(rows):
+            buf[day_idx] = row
+            
+            # Record twilight durations from the times the worker already computed
+            if twilight_times is not None:
+                record_twilight_durations(twilight_times, durations, day_idx)
+            
+            if (day_idx + 1) % 50 == 0:
+                print(f"Processed {day_idx + 1}/{total_days} days...")
     
     # Create main visualization
     print("Creating advanced twilight image...")
-    img_height = len(all_pixels)
-    img = Image.new('RGB', (IMG_WIDTH, img_height))
-    pixels_flat = [pixel for row in all_pixels for pixel in row]
-    img.putdata(pixels_flat)
+    img = Image.fromarray(buf, 'RGB')
     img.save(OUTPUT_FILE)
     
     print(f"Advanced twilight visualization saved as {OUTPUT_FILE}")
     
     # Print statistics
-    print_twilight_statistics(twilight_stats, total_days)
+    print_twilight_statistics(collect_twilight_stats(durations), total_days)
 
-def collect_twilight_stats(day_data, sky_palette, stats):
-    """Collect statistics about twilight types throughout the year."""
-    date_str = day_data['date']
-    sunrise = day_data['sunrise']
-    sunset = day_data['sunset']
-    
-    if not all([date_str, sunrise, sunset]):
-        return
-    
-    twilight_calc = TwilightCalculator()
-    twilight_times = twilight_calc.calculate_twilight_times(date_str, sunrise, sunset)
-    
-    # Count different twilight types based on duration
-    for twilight_type, times in twilight_times.items():
+def record_twilight_durations(twilight_times, durations, day_idx):
+    """Store one day's twilight durations (evening - morning) in the per-type arrays."""
+    for twilight_type, column in durations.items():
+        times = twilight_times.get(twilight_type, {})
         if 'morning' in times and 'evening' in times:
-            duration = times['evening'] - times['morning']
-            
-            if twilight_type == 'golden_hour' and duration > 2:
-                stats['golden_hours'] += 1
-            elif twilight_type == 'blue_hour' and duration > 1:
-                stats['blue_hours'] += 1
-            elif twilight_type == 'civil' and duration > 13:
-                stats['civil_twilight'] += 1
-            elif twilight_type == 'nautical' and duration > 14:
-                stats['nautical_twilight'] += 1
-            elif twilight_type == 'astronomical' and duration > 15:
-                stats['astronomical_twilight'] += 1
+            column[day_idx] = times['evening'] - times['morning']
+
+def collect_twilight_stats(durations):
+    """Count days whose twilight durations exceed each statistic's threshold."""
+    # Missing days stay NaN and never compare greater than a threshold
+    return {
+        stat: int((durations[twilight_type] > min_hours).sum())
+        for stat, (twilight_type, min_hours) in TWILIGHT_STAT_THRESHOLDS.items()
+    }
 
 def print_twilight_statistics(stats, total_days):
     """Print twilight statistics for the visualization."""
@@ -180,7 +215,7 @@ def print_twilight_statistics(stats, total_days):
     print("- Blue hour: Deep blue sky before sunrise/after sunset") 
     print("- Golden hour: Warm light when sun is low on horizon")
 
-def create_twilight_comparison_image():
+def create_twilight_comparison_image(sun_df=None, moon_df=None):
     """Create side-by-side comparison of basic vs advanced twilight."""
     print(f"\n🎨 CREATING TWILIGHT COMPARISON")
     print("="*50)
@@ -192,52 +227,38 @@ def create_twilight_comparison_image():
     advanced_palette = AdvancedSkyPalette()
     
     # Load sample data
-    sun_df, moon_df = load_astronomical_data()
+    if sun_df is None or moon_df is None:
+        sun_df, moon_df = load_astronomical_data()
     if sun_df is None:
         return
     
     # Select interesting days (equinoxes and solstices)
     sample_days = [79, 172, 266, 355]  # Approximate equinoxes and solstices
     
-    comparison_pixels = []
+    buf = np.empty((len(sample_days) * 2, IMG_WIDTH, 3), dtype=np.uint8)
+    comp_height = 0
     
     for day_idx in sample_days:
         day_data = get_day_data(sun_df, moon_df, day_idx)
         
         if day_data:
             # Basic twilight row
-            basic_row = []
-            for hour in range(IMG_WIDTH):
-                color = basic_palette.get_twilight_color(
-                    hour, day_data['sunrise'], day_data['sunset'], day_data['day_of_year']
-                )
-                basic_row.append(color)
-            comparison_pixels.append(basic_row)
+            buf[comp_height] = basic_palette.get_twilight_colors_vec(
+                np.arange(IMG_WIDTH), day_data['sunrise'], day_data['sunset'], day_data['day_of_year']
+            )
             
             # Advanced twilight row
-            advanced_row = []
-            for hour in range(IMG_WIDTH):
-                color = advanced_palette.get_advanced_sky_color(
-                    hour, day_data['sunrise'], day_data['sunset'], 
-                    day_data['date'], day_data['day_of_year']
-                )
-                advanced_row.append(color)
-            comparison_pixels.append(advanced_row)
-    
-    # Create comparison image
-    comp_height = len(comparison_pixels)
-    comp_img = Image.new('RGB', (IMG_WIDTH, comp_height))
-    pixels_flat = [pixel for row in comparison_pixels for pixel in row]
-    comp_img.putdata(pixels_flat)
-    
-    # Scale up for better visibility
+            buf[comp_height + 1] = advanced_palette.get_advanced_sky_colors_vec(
+                np.arange(IMG_WIDTH), day_data['sunrise'], day_data['sunset'],
+                day_data['date'], day_data['day_of_year']
+            )
+            comp_height += 2
+    
+    # Scale up for better visibility by repeating pixels directly on the array
     scale_factor = 20
-    comp_img_scaled = comp_img.resize(
-        (IMG_WIDTH * scale_factor, comp_height * scale_factor),
-        Image.Resampling.NEAREST
-    )
+    scaled = np.repeat(np.repeat(buf[:comp_height], scale_factor, axis=0), scale_factor, axis=1)
     
-    comp_img_scaled.save(COMPARISON_FILE)
+    Image.fromarray(scaled, 'RGB').save(COMPARISON_FILE)
     print(f"Twilight comparison saved as {COMPARISON_FILE}")
     print("Comparison shows basic (odd rows) vs advanced (even rows) twilight")
 
@@ -277,11 +298,14 @@ if __name__ == "__main__":
     print("🌅 ADVANCED TWILIGHT VISUALIZATION SYSTEM")
     print("="*70)
     
+    # Read the CSVs once and share them between both images
+    sun_df, moon_df = load_astronomical_data()
+    
     # Create the advanced visualization
-    create_advanced_twilight_visualization()
+    create_advanced_twilight_visualization(sun_df, moon_df)
     
     # Create comparison
-    create_twilight_comparison_image()
+    create_twilight_comparison_image(sun_df, moon_df)
     
     # Demonstrate features
     demonstrate_twilight_features()
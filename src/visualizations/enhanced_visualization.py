@@ -3,6 +3,7 @@ Enhanced Time's Pixel Visualization with improved color palettes and twilight tr
 This version uses the new color palette system for more realistic and beautiful visualizations.
 """
 import pandas as pd
+import numpy as np
 from PIL import Image
 import sys
 import os
@@ -14,8 +15,11 @@ if project_root not in sys.path:
 
 # Import our new modules
 try:
-    from src.core.color_palettes import create_palette, get_moon_phase
-    from src.core.time_utils import load_astronomical_data, get_day_data, generate_hour_pixels
+    from src.core.color_palettes import create_palette, get_moon_phase, precompute_day_tables
+    from src.core.time_utils import (
+        load_astronomical_data, get_day_data, get_day_arrays, generate_hour_pixels,
+        generate_hour_pixels_batch
+    )
 except ImportError as e:
     print(f"Error importing modules: {e}")
     print(f"Project root: {project_root}")
@@ -44,16 +48,16 @@ def create_enhanced_visualization():
     
     # Generate pixels for each day
     print("Generating enhanced pixel art...")
-    all_pixels = []
     total_days = min(len(sun_df), len(moon_df))
+    all_pixels = np.empty((total_days, IMG_WIDTH, 3), dtype=np.uint8)
+    tables = precompute_day_tables(366)
     
     for day_idx in range(total_days):
         # Get day data
         day_data = get_day_data(sun_df, moon_df, day_idx)
         
-        # Generate hour pixels with enhanced colors
-        hour_pixels = generate_hour_pixels(day_data, palette, IMG_WIDTH)
-        all_pixels.append(hour_pixels)
+        # Generate hour pixels with enhanced colors straight into the image buffer
+        all_pixels[day_idx] = generate_hour_pixels(day_data, palette, IMG_WIDTH, tables)
         
         # Progress indicator
         if (day_idx + 1) % 50 == 0:
@@ -62,11 +66,9 @@ def create_enhanced_visualization():
     # Create image
     print("Creating image...")
     img_height = len(all_pixels)
-    img = Image.new('RGB', (IMG_WIDTH, img_height))
     
-    # Flatten pixel data for PIL
-    pixels_flat = [pixel for row in all_pixels for pixel in row]
-    img.putdata(pixels_flat)
+    # PIL wraps the contiguous uint8 buffer in one bulk copy
+    img = Image.fromarray(all_pixels, 'RGB')
     
     # Save image
     img.save(OUTPUT_FILE)
@@ -91,34 +93,22 @@ def create_palette_comparison():
     palettes = ["naturalistic", "vibrant", "monochrome", "classic"]
     sample_days = [1, 91, 182, 273]  # Winter, Spring, Summer, Autumn
     
-    comparison_pixels = []
-    
-    for palette_name in palettes:
-        palette = create_palette(palette_name)
-        palette_row = []
-        
-        for day_idx in sample_days:
-            day_data = get_day_data(sun_df, moon_df, day_idx)
-            hour_pixels = generate_hour_pixels(day_data, palette, IMG_WIDTH)
-            palette_row.extend(hour_pixels)
-        
-        comparison_pixels.append(palette_row)
-    
-    # Create comparison image
     comp_width = IMG_WIDTH * len(sample_days)
     comp_height = len(palettes)
-    comp_img = Image.new('RGB', (comp_width, comp_height))
     
-    pixels_flat = [pixel for row in comparison_pixels for pixel in row]
-    comp_img.putdata(pixels_flat)
+    # Every palette x sample day in one batched call: (palettes, days, hours, 3),
+    # so each palette's days already sit side by side in one row
+    days = {key: values[sample_days] for key, values in get_day_arrays(sun_df, moon_df).items()}
+    comparison_pixels = generate_hour_pixels_batch(
+        days, [create_palette(name) for name in palettes], IMG_WIDTH, precompute_day_tables(366)
+    ).reshape(comp_height, comp_width, 3)
     
-    # Scale up for better visibility
+    # Scale up for better visibility; kron with a block of ones repeats each
+    # pixel into a scale_factor square, the same as a NEAREST resize
     scale_factor = 10
-    comp_img_scaled = comp_img.resize(
-        (comp_width * scale_factor, comp_height * scale_factor), 
-        Image.Resampling.NEAREST
-    )
+    comparison_scaled = np.kron(comparison_pixels, np.ones((scale_factor, scale_factor, 1), dtype=np.uint8))
     
+    comp_img_scaled = Image.fromarray(comparison_scaled, 'RGB')
     comp_img_scaled.save("palette_comparison.png")
     print("Palette comparison saved as palette_comparison.png")
 
@@ -7,6 +7,7 @@ import pygame
 import sys
 import math
 import os
+import numpy as np
 from datetime import datetime
 
 # Add project root to Python path for imports
@@ -15,10 +16,13 @@ sys.path.insert(0, project_root)
 
 # Import our enhanced modules
 try:
-    from src.core.twilight_calculator import AdvancedSkyPalette, TwilightCalculator
-    from src.core.time_utils import load_astronomical_data, get_day_data, hour_to_time
+    from src.core.twilight_calculator import AdvancedSkyPalette, TwilightCalculator, SKY_TYPES
+    from src.core.time_utils import (
+        load_astronomical_data, get_day_arrays, day_arrays_to_records, hour_to_time
+    )
     from src.core.moon_phases import MoonPhaseCalculator, EnhancedMoonVisualizer
     from src.core.color_palettes import create_palette
+    from src.core._pixel_numba import brighten_array
 except ImportError as e:
     print(f"Error importing modules: {e}")
     print("Make sure you're running this from the project root directory or the modules are installed")
@@ -91,6 +95,11 @@ class InteractiveTimePixel:
         self.font_medium = pygame.font.Font(None, 20)
         self.font_small = pygame.font.Font(None, 16)
         
+        # Rendered text surfaces keyed by (font, text, color); the panel redraws
+        # the same strings every frame
+        self._text_cache = {}
+        self._max_text_cache = 512
+        
         # Initialize systems
         self.sky_palette = AdvancedSkyPalette()
         self.moon_calculator = MoonPhaseCalculator()
@@ -123,12 +132,18 @@ class InteractiveTimePixel:
         print("Pre-generating enhanced pixels for smooth interaction...")
         self.all_pixels = self.generate_all_pixels()
         
-        # Create pixel surface for efficient blitting
-        self.pixel_surface = pygame.Surface((self.vis_width, self.vis_height))
+        # Render the pixels once; hover and selection only repaint their cells
+        self.update_native_surface()
+        self.render_base_surface()
+        self.pixel_surface = pygame.Surface((self.vis_width, self.vis_height)).convert()
         self.update_pixel_surface()
         
-        # Create viewport surface for scrolling
-        self.viewport_surface = pygame.Surface((self.viewport_width, self.viewport_height))
+        # Create viewport surface for scrolling; every surface is converted to the
+        # display's pixel format so per-frame blits are plain copies
+        self.viewport_surface = pygame.Surface((self.viewport_width, self.viewport_height)).convert()
+        
+        # Background, frame and title of the info panel never change
+        self.render_static_panel()
         
         print(f"Interactive visualization ready!")
         print(f"Window size: {self.window_width}x{self.window_height}")
@@ -139,112 +154,150 @@ class InteractiveTimePixel:
         print(f"Max scroll: {self.max_scroll_y}px")
     
     def generate_all_pixels(self):
-        """Pre-generate all pixels for the entire year."""
-        all_pixels = []
-        total_days = min(len(self.sun_df), len(self.moon_df))
-        
-        for day_idx in range(total_days):
-            day_data = get_day_data(self.sun_df, self.moon_df, day_idx)
-            hour_pixels = self.generate_enhanced_hour_pixels(day_data)
-            all_pixels.append(hour_pixels)
-            
-            if (day_idx + 1) % 50 == 0:
-                print(f"Pre-generated {day_idx + 1}/{total_days} days...")
-        
-        return all_pixels
-    
-    def generate_enhanced_hour_pixels(self, day_data):
-        """Generate enhanced pixel colors for all hours of a day."""
-        if day_data is None:
-            return [(30, 30, 60)] * self.IMG_WIDTH
-        
-        pixels = []
-        date_str = day_data['date']
-        day_of_year = day_data['day_of_year']
-        sunrise = day_data['sunrise']
-        sunset = day_data['sunset']
-        moonrise = day_data['moonrise']
-        moonset = day_data['moonset']
-        
-        # Get moon phase data
-        moon_illumination = self.moon_calculator.get_moon_illumination(date_str) if date_str else 0.5
-        
-        for hour in range(self.IMG_WIDTH):
-            # Get advanced sky color
-            sky_color = self.sky_palette.get_advanced_sky_color(
-                hour, sunrise, sunset, date_str or "2024-01-01", day_of_year or 1
-            )
-            
-            # Check if moon is up
-            moon_up = False
-            if moonrise is not None and moonset is not None:
-                if moonrise < moonset:
-                    moon_up = moonrise <= hour < moonset
-                else:
-                    moon_up = hour >= moonrise or hour < moonset
-            
-            if moon_up and date_str:
-                # Get moon color based on phase
-                moon_color = self.moon_visualizer.get_moon_color_by_phase(date_str)
-                
-                # Blend moon with sky based on illumination
-                opacity = 0.1 + (moon_illumination * 0.4)
-                final_color = self.overlay_color_with_opacity(sky_color, moon_color, opacity)
-            else:
-                final_color = sky_color
-            
-            pixels.append(final_color)
-        
+        """Pre-generate all pixels for the entire year as a (days, IMG_WIDTH, 3) uint8 array.
+        
+        Every day is rendered by AdvancedSkyPalette.render_sky_year in a single call.
+        """
+        days = get_day_arrays(self.sun_df, self.moon_df)
+        total_days = len(days['date'])
+        
+        # Per-day info dicts for the hover/selection panels, built once
+        self._day_cache = day_arrays_to_records(days)
+        
+        # Moon phase values for every dated day at once; days without a date
+        # never show the moon
+        has_date = np.array([bool(date_str) for date_str in days['date']])
+        moon_color = np.zeros((total_days, 3))
+        opacity = np.zeros(total_days)
+        dated = days['date'][has_date].tolist()
+        if dated:
+            _, illumination = self.moon_calculator.get_moon_phases_vec(dated)
+            moon_color[has_date] = self.moon_visualizer.get_moon_colors_by_phase_vec(dated)
+            opacity[has_date] = 0.1 + (illumination * 0.4)
+        
+        # Sky, twilight and moon overlay for the whole year in one compiled pass;
+        # the sky type behind each pixel is kept for the info panel
+        pixels, self._sky_type_grid = self.sky_palette.render_sky_year(
+            days['sunrise'], days['sunset'], np.maximum(days['day_of_year'], 1),
+            np.where(has_date, days['moonrise'], np.nan), days['moonset'],
+            moon_color, opacity, self.IMG_WIDTH, return_sky_types=True
+        )
         return pixels
     
-    def overlay_color_with_opacity(self, base_color, overlay_color, opacity):
-        """Overlay one color on another with specified opacity."""
-        opacity = max(0, min(1, opacity))
-        r_base, g_base, b_base = base_color
-        r_over, g_over, b_over = overlay_color
-        
-        r = int(r_base * (1 - opacity) + r_over * opacity)
-        g = int(g_base * (1 - opacity) + g_over * opacity)
-        b = int(b_base * (1 - opacity) + b_over * opacity)
+    def get_cached_day_data(self, day_idx):
+        """get_day_data for a day index, read from the cache built with the pixels."""
+        if 0 <= day_idx < len(self._day_cache):
+            return self._day_cache[day_idx]
+        return None
+    
+    def update_native_surface(self):
+        """Copy the pixel array into self._native, one surface pixel per day/hour."""
+        self._native = pygame.Surface((self.IMG_WIDTH, len(self.all_pixels))).convert()
+        pygame.surfarray.blit_array(self._native, self.all_pixels.swapaxes(0, 1))  # surfarray is (x, y)
+        self._base_pixel_size = None  # scaled render is stale
+    
+    def render_base_surface(self):
+        """Render every pixel, without highlights, into self._base_surface.
+        
+        The native surface is scaled up by SDL instead of drawing a rect per
+        pixel, and only when the pixel size has changed since the last render;
+        grid lines come from self._grid_overlay, drawn once per render and
+        reused for highlighted cells.
+        """
+        if self._base_pixel_size == self.pixel_size:
+            return
         
-        return (r, g, b)
+        days = len(self.all_pixels)
+        self._base_surface = pygame.Surface((self.vis_width, self.vis_height)).convert()
+        self._base_surface.fill((0, 0, 0))
+        self._base_surface.blit(
+            pygame.transform.scale(self._native, (self.IMG_WIDTH * self.pixel_size, days * self.pixel_size)),
+            (0, 0)
+        )
+        
+        # Draw subtle grid lines for better visibility
+        self._grid_overlay = self.create_grid_overlay(days) if self.pixel_size >= 15 else None
+        if self._grid_overlay is not None:
+            self._base_surface.blit(self._grid_overlay, (0, 0))
+        self._base_pixel_size = self.pixel_size
+    
+    def create_grid_overlay(self, days):
+        """Transparent surface with a one-pixel grid line around every cell.
+        
+        Each cell's border is its first and last row and column, so the grid is
+        a pair of full-length lines per row and column of cells.
+        """
+        width, height = self.IMG_WIDTH * self.pixel_size, days * self.pixel_size
+        overlay = pygame.Surface((width, height), pygame.SRCALPHA).convert_alpha()
+        line_color = (60, 60, 60, 255)
+        
+        for start in range(0, width, self.pixel_size):
+            for x in (start, start + self.pixel_size - 1):
+                pygame.draw.line(overlay, line_color, (x, 0), (x, height - 1))
+        for start in range(0, height, self.pixel_size):
+            for y in (start, start + self.pixel_size - 1):
+                pygame.draw.line(overlay, line_color, (0, y), (width - 1, y))
+        return overlay
+    
+    def draw_cell(self, surface, day_idx, hour_idx, color):
+        """Draw one day/hour pixel, with a subtle grid line when pixels are large."""
+        rect = pygame.Rect(hour_idx * self.pixel_size, day_idx * self.pixel_size,
+                           self.pixel_size, self.pixel_size)
+        pygame.draw.rect(surface, color, rect)
+        
+        # Copy the cell's grid lines from the prerendered overlay
+        if self._grid_overlay is not None:
+            surface.blit(self._grid_overlay, rect, rect)
     
     def update_pixel_surface(self):
-        """Update the pixel surface with current visualization data."""
-        self.pixel_surface.fill((0, 0, 0))
+        """Rebuild the pixel surface from the base render plus current highlights."""
+        self.pixel_surface.blit(self._base_surface, (0, 0))
+        self._highlights = {}
+        self._highlight_cells = None
+        self.refresh_highlights()
+    
+    def refresh_highlights(self):
+        """Repaint only the cells whose hover/selection highlight changed."""
+        # Scrolling and key presses redraw without moving the hover or selection
+        cells = (self.hover_day, self.hover_hour, self.selected_day, self.selected_hour)
+        if cells == self._highlight_cells:
+            return
+        self._highlight_cells = cells
         
-        for day_idx, day_pixels in enumerate(self.all_pixels):
-            y = day_idx * self.pixel_size
-            
-            for hour_idx, color in enumerate(day_pixels):
-                x = hour_idx * self.pixel_size
-                
-                # Draw pixel with hover/selection highlighting
-                pixel_color = color
-                
-                # Highlight hovered pixel
-                if (self.hover_day == day_idx and self.hover_hour == hour_idx):
-                    pixel_color = self.brighten_color(color, 1.3)
-                
-                # Highlight selected pixel
-                if (self.selected_day == day_idx and self.selected_hour == hour_idx):
-                    pixel_color = self.brighten_color(color, 1.5)
-                
-                # Draw the pixel
-                rect = pygame.Rect(x, y, self.pixel_size, self.pixel_size)
-                pygame.draw.rect(self.pixel_surface, pixel_color, rect)
-                
-                # Draw subtle grid lines for better visibility
-                if self.pixel_size >= 15:
-                    pygame.draw.rect(self.pixel_surface, (60, 60, 60), rect, 1)
+        highlights = self.get_highlight_colors()
+        if highlights == self._highlights:
+            return
+        
+        # Restore cells that are no longer highlighted from the base render
+        for day_idx, hour_idx in self._highlights.keys() - highlights.keys():
+            rect = pygame.Rect(hour_idx * self.pixel_size, day_idx * self.pixel_size,
+                               self.pixel_size, self.pixel_size)
+            self.pixel_surface.blit(self._base_surface, rect, rect)
+        
+        for (day_idx, hour_idx), color in highlights.items():
+            self.draw_cell(self.pixel_surface, day_idx, hour_idx, color)
+        self._highlights = highlights
     
-    def brighten_color(self, color, factor):
-        """Brighten a color by a given factor."""
-        r, g, b = color
-        r = min(255, int(r * factor))
-        g = min(255, int(g * factor))
-        b = min(255, int(b * factor))
-        return (r, g, b)
+    def get_highlight_colors(self):
+        """Brightened colors for the hovered (1.3x) and selected (1.5x) pixels.
+        
+        Returns {(day, hour): color}; selection wins when both are the same pixel.
+        """
+        cells = [
+            (day, hour, factor)
+            for day, hour, factor in ((self.hover_day, self.hover_hour, 1.3),
+                                      (self.selected_day, self.selected_hour, 1.5))
+            if day is not None and hour is not None
+        ]
+        if not cells:
+            return {}
+        
+        days, hours, factors = (np.array(values) for values in zip(*cells))
+        colors = brighten_array(self.all_pixels[days, hours], factors.astype(np.float64))
+        return {
+            (day, hour): tuple(color)
+            for day, hour, color in zip(days.tolist(), hours.tolist(), colors.tolist())
+        }
     
     def get_pixel_from_mouse(self, mouse_pos):
         """Convert mouse position to day/hour coordinates considering scroll."""
@@ -269,22 +322,27 @@ class InteractiveTimePixel:
         
         return None, None
     
-    def draw_ui_panel(self):
-        """Draw the information panel on the right side."""
-        panel_x = self.viewport_width + 10
-        panel_width = self.ui_width - 20
-        panel_rect = pygame.Rect(panel_x, 10, panel_width, self.window_height - 20)
+    def render_static_panel(self):
+        """Render the UI column's background, panel frame and title into self._static_panel."""
+        self._static_panel = pygame.Surface((self.ui_width, self.window_height)).convert()
+        self._static_panel.fill(self.ui_colors['background'])
         
         # Background panel
-        pygame.draw.rect(self.screen, self.ui_colors['panel'], panel_rect)
-        pygame.draw.rect(self.screen, self.ui_colors['border'], panel_rect, 2)
-        
-        y_offset = 30
+        panel_rect = pygame.Rect(10, 10, self.ui_width - 20, self.window_height - 20)
+        pygame.draw.rect(self._static_panel, self.ui_colors['panel'], panel_rect)
+        pygame.draw.rect(self._static_panel, self.ui_colors['border'], panel_rect, 2)
         
         # Title
-        title = self.font_large.render("Time's Pixel Explorer", True, self.ui_colors['text'])
-        self.screen.blit(title, (panel_x + 15, y_offset))
-        y_offset += 40
+        title = self.render_text(self.font_large, "Time's Pixel Explorer", self.ui_colors['text'])
+        self._static_panel.blit(title, (25, 30))
+    
+    def draw_ui_panel(self):
+        """Draw the information panel on the right side."""
+        panel_x = self.viewport_width + 10
+        
+        # Background, frame and title come prerendered
+        self.screen.blit(self._static_panel, (self.viewport_width, 0))
+        y_offset = 70
         
         # Current scroll position info
         if self.max_scroll_y > 0:
@@ -294,7 +352,7 @@ class InteractiveTimePixel:
             
             # Get current month info
             if current_day < len(self.all_pixels):
-                day_data = get_day_data(self.sun_df, self.moon_df, current_day)
+                day_data = self.get_cached_day_data(current_day)
                 if day_data and day_data['date']:
                     from datetime import datetime
                     try:
@@ -308,13 +366,13 @@ class InteractiveTimePixel:
             else:
                 scroll_info = f"📅 Days {current_day + 1}-{end_day}/366"
             
-            scroll_surface = self.font_small.render(scroll_info, True, self.ui_colors['highlight'])
+            scroll_surface = self.render_text(self.font_small, scroll_info, self.ui_colors['highlight'])
             self.screen.blit(scroll_surface, (panel_x + 15, y_offset))
             y_offset += 25
         
         # Current palette info
         palette_text = f"Palette: {self.palette_options[self.current_palette_idx].title()}"
-        palette_surface = self.font_medium.render(palette_text, True, self.ui_colors['text'])
+        palette_surface = self.render_text(self.font_medium, palette_text, self.ui_colors['text'])
         self.screen.blit(palette_surface, (panel_x + 15, y_offset))
         y_offset += 30
         
@@ -339,7 +397,7 @@ class InteractiveTimePixel:
         
         for instruction in instructions:
             color = self.ui_colors['highlight'] if instruction.startswith(('🖱️', '📊')) else self.ui_colors['text']
-            inst_surface = self.font_small.render(instruction, True, color)
+            inst_surface = self.render_text(self.font_small, instruction, color)
             self.screen.blit(inst_surface, (panel_x + 15, y_offset))
             y_offset += 18
         
@@ -354,6 +412,18 @@ class InteractiveTimePixel:
         if self.selected_day is not None and self.selected_hour is not None:
             self.draw_detailed_info(panel_x + 15, y_offset)
     
+    def render_text(self, font, text, color):
+        """font.render with antialiasing, memoized so each string is rasterized once."""
+        key = (id(font), text, color)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            # Drop the oldest half when full so hover text cannot grow it forever
+            if len(self._text_cache) >= self._max_text_cache:
+                for old_key in list(self._text_cache)[:self._max_text_cache // 2]:
+                    del self._text_cache[old_key]
+            surface = self._text_cache[key] = font.render(text, True, color)
+        return surface
+    
     def draw_scrollbar(self):
         """Draw scrollbar if content is scrollable."""
         if self.max_scroll_y <= 0:
@@ -380,39 +450,39 @@ class InteractiveTimePixel:
     
     def draw_hover_info(self, x, y):
         """Draw hover information for current mouse position."""
-        day_data = get_day_data(self.sun_df, self.moon_df, self.hover_day)
+        day_data = self.get_cached_day_data(self.hover_day)
         
         if day_data:
             # Quick hover info
-            hover_title = self.font_medium.render("🔍 HOVER INFO", True, self.ui_colors['highlight'])
+            hover_title = self.render_text(self.font_medium, "🔍 HOVER INFO", self.ui_colors['highlight'])
             self.screen.blit(hover_title, (x, y))
             y += 25
             
             date_text = f"Date: {day_data['date']}"
             hour_text = f"Hour: {self.hover_hour:02d}:00"
             
-            date_surface = self.font_small.render(date_text, True, self.ui_colors['text'])
-            hour_surface = self.font_small.render(hour_text, True, self.ui_colors['text'])
+            date_surface = self.render_text(self.font_small, date_text, self.ui_colors['text'])
+            hour_surface = self.render_text(self.font_small, hour_text, self.ui_colors['text'])
             
             self.screen.blit(date_surface, (x, y))
             self.screen.blit(hour_surface, (x, y + 18))
             
             # Color preview
-            if self.hover_day < len(self.all_pixels) and self.hover_hour < len(self.all_pixels[self.hover_day]):
-                color = self.all_pixels[self.hover_day][self.hover_hour]
+            if self.hover_day < self.all_pixels.shape[0] and self.hover_hour < self.all_pixels.shape[1]:
+                color = self.all_pixels[self.hover_day, self.hover_hour].tolist()
                 color_rect = pygame.Rect(x + 150, y, 30, 30)
                 pygame.draw.rect(self.screen, color, color_rect)
                 pygame.draw.rect(self.screen, self.ui_colors['border'], color_rect, 2)
     
     def draw_detailed_info(self, x, y):
         """Draw detailed information for selected pixel."""
-        day_data = get_day_data(self.sun_df, self.moon_df, self.selected_day)
+        day_data = self.get_cached_day_data(self.selected_day)
         
         if not day_data:
             return
         
         # Detailed info title
-        detail_title = self.font_medium.render("📋 SELECTED PIXEL", True, self.ui_colors['highlight'])
+        detail_title = self.render_text(self.font_medium, "📋 SELECTED PIXEL", self.ui_colors['highlight'])
         self.screen.blit(detail_title, (x, y))
         y += 30
         
@@ -449,12 +519,7 @@ class InteractiveTimePixel:
         
         # Sky condition at selected hour
         if self.show_twilight_info and day_data['date']:
-            twilight_times = self.twilight_calculator.calculate_twilight_times(
-                day_data['date'], day_data['sunrise'], day_data['sunset']
-            )
-            sky_type = self.twilight_calculator.get_sky_type(
-                self.selected_hour, day_data['sunrise'], day_data['sunset'], twilight_times
-            )
+            sky_type = SKY_TYPES[self._sky_type_grid[self.selected_day, self.selected_hour]]
             
             info_lines.extend([
                 "",
@@ -469,7 +534,7 @@ class InteractiveTimePixel:
                 continue
             
             color = self.ui_colors['highlight'] if line.startswith(('☀️', '🌙', '🌅')) else self.ui_colors['text']
-            line_surface = self.font_small.render(line, True, color)
+            line_surface = self.render_text(self.font_small, line, color)
             self.screen.blit(line_surface, (x, y))
             y += 18
     
@@ -506,6 +571,28 @@ class InteractiveTimePixel:
         scroll_amount = y_scroll * self.scroll_speed
         self.scroll_y = max(0, min(self.max_scroll_y, self.scroll_y - scroll_amount))
     
+    def redraw(self):
+        """Draw the visualization viewport, scrollbar and info panel, then flip."""
+        # Repaint the cells whose hover/selection state changed
+        self.refresh_highlights()
+        
+        # Create viewport of the visualization
+        visible_rect = pygame.Rect(0, self.scroll_y, self.viewport_width, self.viewport_height)
+        self.viewport_surface.fill((0, 0, 0))
+        self.viewport_surface.blit(self.pixel_surface, (0, -self.scroll_y))
+        
+        # Draw viewport to screen
+        self.screen.blit(self.viewport_surface, (0, 0))
+        
+        # Draw scrollbar
+        self.draw_scrollbar()
+        
+        # Draw UI panel
+        self.draw_ui_panel()
+        
+        # Update display
+        pygame.display.flip()
+    
     def run(self):
         """Main interactive loop."""
         clock = pygame.time.Clock()
@@ -523,8 +610,13 @@ class InteractiveTimePixel:
         print(f"Pixel size: {self.pixel_size}x{self.pixel_size}")
         print(f"Scrollable content: {self.vis_height}px")
         
+        self._dirty = True
         while running:
             for event in pygame.event.get():
+                if event.type != pygame.MOUSEMOTION:
+                    # Keys, scrolling, clicks and window events can all change the view
+                    self._dirty = True
+                
                 if event.type == pygame.QUIT:
                     running = False
                 
@@ -535,8 +627,11 @@ class InteractiveTimePixel:
                     self.handle_mouse_scroll(event.y)
                 
                 elif event.type == pygame.MOUSEMOTION:
-                    # Update hover state
-                    self.hover_day, self.hover_hour = self.get_pixel_from_mouse(event.pos)
+                    # Update hover state; moving within the same pixel needs no redraw
+                    hover = self.get_pixel_from_mouse(event.pos)
+                    if hover != (self.hover_day, self.hover_hour):
+                        self.hover_day, self.hover_hour = hover
+                        self._dirty = True
                 
                 elif event.type == pygame.MOUSEBUTTONDOWN:
                     if event.button == 1:  # Left click
@@ -546,7 +641,7 @@ class InteractiveTimePixel:
                             self.selected_hour = hour
                             
                             # Print detailed info to console as well
-                            day_data = get_day_data(self.sun_df, self.moon_df, day)
+                            day_data = self.get_cached_day_data(day)
                             if day_data:
                                 print(f"\n📍 SELECTED: {day_data['date']} at {hour:02d}:00")
                                 if day_data['date']:
@@ -555,29 +650,11 @@ class InteractiveTimePixel:
                                     print(f"   Moon: {phase} ({illumination:.1%} illuminated)")
                                     print(f"   Scroll position: {self.scroll_y}/{self.max_scroll_y}")
             
-            # Update pixel surface if hover changed
-            if self.hover_day is not None or self.selected_day is not None:
-                self.update_pixel_surface()
-            
-            # Draw everything
-            self.screen.fill(self.ui_colors['background'])
-            
-            # Create viewport of the visualization
-            visible_rect = pygame.Rect(0, self.scroll_y, self.viewport_width, self.viewport_height)
-            self.viewport_surface.fill((0, 0, 0))
-            self.viewport_surface.blit(self.pixel_surface, (0, -self.scroll_y))
-            
-            # Draw viewport to screen
-            self.screen.blit(self.viewport_surface, (0, 0))
-            
-            # Draw scrollbar
-            self.draw_scrollbar()
-            
-            # Draw UI panel
-            self.draw_ui_panel()
+            # Only redraw when an event changed something on screen
+            if self._dirty:
+                self.redraw()
+                self._dirty = False
             
-            # Update display
-            pygame.display.flip()
             clock.tick(60)  # 60 FPS for smooth interaction
         
         pygame.quit()
@@ -14,9 +14,14 @@ import pygame
 import numpy as np
 import math
 import csv
+import os
 from datetime import datetime, timedelta
 from typing import List, Tuple, Dict, Optional
 
+# Project data directory, resolved once at import
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+data_dir = os.path.join(project_root, 'data')
+
 class TimeSpiral3D:
     """3D Time Spiral Visualization"""
     
@@ -57,6 +62,12 @@ class TimeSpiral3D:
             'winter': (150, 200, 255)   # Winter - Ice blue
         }
         
+        # Info panel font, loaded once, and its rendered lines keyed by
+        # (text, color); most lines (emoji included) never change between frames
+        self.info_font = pygame.font.Font(None, 24)
+        self._text_cache = {}
+        self._max_text_cache = 512
+        
         self.load_data()
         self.generate_spiral()
         
@@ -71,11 +82,8 @@ class TimeSpiral3D:
     def load_data(self):
         """Load sun and moon rise/set data"""
         try:
-            # Try to use the proper data path relative to project root
-            import os
-            project_root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
-            sun_data_path = os.path.join(project_root, 'data', 'hongkong_sunrise_sunset_2024_clean.csv')
-            moon_data_path = os.path.join(project_root, 'data', 'moonrise_moonset_2024_clean.csv')
+            sun_data_path = os.path.join(data_dir, 'hongkong_sunrise_sunset_2024_clean.csv')
+            moon_data_path = os.path.join(data_dir, 'moonrise_moonset_2024_clean.csv')
             
             # Load sun data (sunrise, transit, sunset)
             with open(sun_data_path, 'r') as f:
@@ -332,7 +340,6 @@ class TimeSpiral3D:
     
     def render_info(self):
         """Render information panel"""
-        font = pygame.font.Font(None, 24)
         info_lines = [
             "🌟 Time Spiral - Hong Kong 2024",
             f"📊 {len(self.spiral_points)} days visualized",
@@ -358,10 +365,22 @@ class TimeSpiral3D:
         y_offset = 10
         for line in info_lines:
             if line:  # Skip empty lines
-                text = font.render(line, True, (255, 255, 255))
+                text = self.render_text(line, (255, 255, 255))
                 self.screen.blit(text, (10, y_offset))
             y_offset += 20
     
+    def render_text(self, text, color):
+        """info_font.render with antialiasing, memoized so each string is rasterized once"""
+        key = (text, color)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            # Zoom changes add new lines, so drop the oldest half when full
+            if len(self._text_cache) >= self._max_text_cache:
+                for old_key in list(self._text_cache)[:self._max_text_cache // 2]:
+                    del self._text_cache[old_key]
+            surface = self._text_cache[key] = self.info_font.render(text, True, color)
+        return surface
+    
     def update(self):
         """Update animation"""
         if self.auto_rotate:
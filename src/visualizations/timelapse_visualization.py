@@ -3,12 +3,46 @@ Hong Kong Skyline Renderer for Time's Pixel
 Creates a realistic Hong Kong Kowloon City skyline silhouette with animated sky background.
 Implements smooth time-lapse animation showing day/night cycles throughout the year.
 """
+import os
+import sys
+
+# Set DEBUG_HEADLESS to render off-screen (previews, scripted sweeps) without a display
+if os.environ.get("DEBUG_HEADLESS"):
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
 import pygame
 import math
 import numpy as np
 from datetime import datetime, timedelta
 from typing import List, Tuple, Dict, Optional
 
+# Add project root to Python path once, at import time, for the src.core imports
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from src.core.visibility import make_visibility, moon_visibility, moon_visibility_vec
+
+# Astronomical modules are optional; without them the engine uses fallback sky and paths
+try:
+    from src.core.twilight_calculator import AdvancedSkyPalette
+    from src.core.moon_phases import MoonPhaseCalculator
+    from src.core.time_utils import load_astronomical_data, get_day_arrays, nan_to_none
+    _astronomy_import_error = None
+except ImportError as e:
+    _astronomy_import_error = e
+
+# Whole minutes of the day as decimal hours, the grid of the visibility tables
+MINUTES_PER_DAY = 24 * 60
+MINUTE_HOURS = np.arange(MINUTES_PER_DAY) / 60
+
+SUN_DATA_FILE = os.path.join(project_root, "data", "hongkong_sunrise_sunset_2024_clean.csv")
+MOON_DATA_FILE = os.path.join(project_root, "data", "moonrise_moonset_2024_clean.csv")
+
+# Parsed (sun_df, moon_df) keyed by (sun_file, moon_file), shared by every
+# SkyAnimationEngine in the process so resizes and previews skip the CSV parse
+_astronomical_data_cache = {}
+
 class HongKongSkylineRenderer:
     """Renders Hong Kong Kowloon City skyline silhouette with detailed building profiles."""
     
@@ -197,6 +231,8 @@ class SkyAnimationEngine:
         self._sun_glow_cache = {}
         self._moon_glow_cache = {}
         self._position_cache = {}
+        self._raw_position_cache = {}  # exact (body, day, hour) -> unsmoothed position
+        self._max_raw_position_cache = 4096
         self._last_cache_time = 0
         
         # Smooth movement tracking
@@ -204,47 +240,34 @@ class SkyAnimationEngine:
         self.moon_pos_history = []
         self.position_smoothing = 0.3  # Interpolation factor for smooth movement
         
-        # Import our existing astronomical systems
+        # Use our existing astronomical systems (imported once at module load)
         print("DEBUG: Starting astronomical data initialization...")
         try:
-            print("DEBUG: Attempting imports...")
-            
-            # Try relative imports first, then absolute
-            try:
-                from src.core.twilight_calculator import AdvancedSkyPalette
-                from src.core.moon_phases import MoonPhaseCalculator
-                from src.core.time_utils import load_astronomical_data, get_day_data
-            except ImportError:
-                # If relative imports fail, try adding the project root to path
-                import sys
-                import os
-                project_root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
-                if project_root not in sys.path:
-                    sys.path.insert(0, project_root)
-                
-                from src.core.twilight_calculator import AdvancedSkyPalette
-                from src.core.moon_phases import MoonPhaseCalculator
-                from src.core.time_utils import load_astronomical_data, get_day_data
-            
-            print("DEBUG: All imports successful")
+            if _astronomy_import_error is not None:
+                raise _astronomy_import_error
             
             self.sky_palette = AdvancedSkyPalette()
             self.moon_calculator = MoonPhaseCalculator()
             print("DEBUG: Astronomical objects created")
             
             # Load astronomical data with absolute paths
-            import os
-            project_root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))  # Go up to project root
-            sun_file = os.path.join(project_root, "data", "hongkong_sunrise_sunset_2024_clean.csv")
-            moon_file = os.path.join(project_root, "data", "moonrise_moonset_2024_clean.csv")
+            sun_file = SUN_DATA_FILE
+            moon_file = MOON_DATA_FILE
             
             print(f"Loading sun data from: {sun_file}")
             print(f"Loading moon data from: {moon_file}")
             print(f"Sun file exists: {os.path.exists(sun_file)}")
             print(f"Moon file exists: {os.path.exists(moon_file)}")
             
-            self.sun_df, self.moon_df = load_astronomical_data(sun_file, moon_file)
+            data_key = (sun_file, moon_file)
+            if data_key in _astronomical_data_cache:
+                print("Reusing astronomical data already loaded in this process")
+                self.sun_df, self.moon_df = _astronomical_data_cache[data_key]
+            else:
+                self.sun_df, self.moon_df = load_astronomical_data(sun_file, moon_file)
             self.has_data = self.sun_df is not None and self.moon_df is not None
+            if self.has_data:
+                _astronomical_data_cache[data_key] = (self.sun_df, self.moon_df)
             
             print(f"Data loading result: has_data = {self.has_data}")
             if self.has_data:
@@ -265,9 +288,25 @@ class SkyAnimationEngine:
     
     def _init_data_caches(self):
         """Initialize astronomical data caches for better performance."""
-        self._astronomical_cache = {}
+        self._day_records = []
         self._sky_color_cache = {}
         self._moon_illumination_cache = {}
+        self._visibility_fn = {}  # day -> make_visibility closure for that day's moon
+        
+        # Moon visibility and arc progress per day at every whole minute,
+        # filled by _precompute_astronomical_data
+        self._moon_vis_mask = np.zeros((367, MINUTES_PER_DAY), dtype=bool)
+        self._moon_vis_prog = np.full((367, MINUTES_PER_DAY), np.nan)
+        
+        # Row of each day of year in _day_records, -1 where there is no data
+        self._day_to_row = np.full(367, -1, dtype=np.int32)
+        
+        # Per-day event times as float arrays indexed by day of year (index 0
+        # unused), NaN where the event does not happen or data is missing
+        self._sunrise = np.full(367, np.nan)
+        self._sunset = np.full(367, np.nan)
+        self._moonrise = np.full(367, np.nan)
+        self._moonset = np.full(367, np.nan)
         
         # Pre-calculate commonly used data if available
         if self.has_data:
@@ -276,43 +315,75 @@ class SkyAnimationEngine:
     def _precompute_astronomical_data(self):
         """Pre-compute astronomical data for all days to improve runtime performance."""
         try:
-            from src.core.time_utils import get_day_data
-            
             print("Pre-computing astronomical data for performance...")
             
-            for day in range(1, 367):  # All days of year
-                day_idx = day - 1
-                day_data = get_day_data(self.sun_df, self.moon_df, day_idx)
-                
-                if day_data:
-                    # Cache the astronomical data
-                    self._astronomical_cache[day] = {
-                        'sunrise': day_data.get('sunrise', 6.0),
-                        'sunset': day_data.get('sunset', 18.0),
-                        'moonrise': day_data.get('moonrise'),
-                        'moonset': day_data.get('moonset'),
-                        'date': day_data.get('date', f'2024-{day:03d}')
-                    }
-                    
-                    # Pre-compute moon illumination if moon calculator available
-                    if hasattr(self, 'moon_calculator') and self.moon_calculator:
-                        try:
-                            base_date = datetime(2024, 1, 1)
-                            current_date = base_date + timedelta(days=day - 1)
-                            date_str = current_date.strftime('%Y-%m-%d')
-                            illumination = self.moon_calculator.get_moon_illumination(date_str)
-                            self._moon_illumination_cache[day] = illumination
-                        except Exception:
-                            self._moon_illumination_cache[day] = 0.5
+            # Parse every column once instead of building a row dict per day
+            days = get_day_arrays(self.sun_df, self.moon_df)
+            num_days = min(len(days['date']), 366)
+            
+            # Map each row to its day of year once; rows with an unparseable
+            # date (day_of_year 0) stay unreachable
+            day_of_year = days['day_of_year'][:num_days]
+            rows = np.flatnonzero((day_of_year >= 1) & (day_of_year <= 366))
+            day_of_year = day_of_year[rows]
+            self._day_to_row[day_of_year] = rows
+            self._sunrise[day_of_year] = days['sunrise'][rows]
+            self._sunset[day_of_year] = days['sunset'][rows]
+            self._moonrise[day_of_year] = days['moonrise'][rows]
+            self._moonset[day_of_year] = days['moonset'][rows]
             
-            print(f"Pre-computed data for {len(self._astronomical_cache)} days")
+            for row in range(num_days):
+                # Dict view of the arrays for the per-frame scalar code paths
+                self._day_records.append({
+                    'sunrise': nan_to_none(days['sunrise'][row]),
+                    'sunset': nan_to_none(days['sunset'][row]),
+                    'moonrise': nan_to_none(days['moonrise'][row]),
+                    'moonset': nan_to_none(days['moonset'][row]),
+                    'date': days['date'][row]
+                })
+            
+            # One vectorized sweep of the whole year at minute resolution
+            self._moon_vis_mask[1:], self._moon_vis_prog[1:] = self.moon_visibility_series(
+                np.arange(1, 367), MINUTE_HOURS
+            )
+            
+            # Pre-compute moon illumination if moon calculator available. A single
+            # try covers the whole sweep; days it does not reach are filled lazily
+            # by get_moon_illumination with its own fallback
+            if hasattr(self, 'moon_calculator') and self.moon_calculator:
+                base_date = datetime(2024, 1, 1)
+                day = None
+                try:
+                    for day in day_of_year.tolist():
+                        current_date = base_date + timedelta(days=day - 1)
+                        date_str = current_date.strftime('%Y-%m-%d')
+                        self._moon_illumination_cache[day] = self.moon_calculator.get_moon_illumination(date_str)
+                except ValueError as e:
+                    print(f"Warning: Moon illumination pre-compute stopped at day {day}: {e}")
+            
+            print(f"Pre-computed data for {len(rows)} days")
             
         except Exception as e:
             print(f"Warning: Could not pre-compute astronomical data: {e}")
     
     def _get_cached_day_data(self, day: int) -> Optional[Dict]:
         """Get cached astronomical data for a specific day."""
-        return self._astronomical_cache.get(day)
+        if not 0 < day < 367:
+            return None
+        row = self._day_to_row[day]
+        return self._day_records[row] if row >= 0 else None
+    
+    def moon_visibility_series(self, days, hours) -> Tuple[np.ndarray, np.ndarray]:
+        """Moon visibility and arc progress for every (day, hour) pair.
+        
+        Returns (visible, progress) arrays of shape (len(days), len(hours)),
+        using the same same-day/cross-day rules as _calculate_moon_visibility.
+        """
+        days = np.asarray(days, dtype=np.int64)
+        hours = np.asarray(hours, dtype=np.float64)
+        return self._calculate_moon_visibility_vec(
+            hours[None, :], self._moonrise[days][:, None], self._moonset[days][:, None]
+        )
     
     def update_animation(self, delta_time: float):
         """Update animation state with time range control and cache management."""
@@ -600,17 +671,35 @@ class SkyAnimationEngine:
         # Apply smoothing
         return self._smooth_position(raw_pos, self.sun_pos_history)
     
-    def _calculate_raw_sun_position(self) -> Tuple[int, int]:
-        """Calculate raw sun position without smoothing."""
-        hour = self.animation_time
+    def _calculate_raw_sun_position(self, day: Optional[int] = None, hour: Optional[float] = None) -> Tuple[int, int]:
+        """Calculate raw sun position without smoothing (defaults to the current day and time)."""
+        day = self.day_of_year if day is None else day
+        hour = self.animation_time if hour is None else hour
         
+        return self._cached_raw_position('sun', day, hour, self._compute_raw_sun_position)
+    
+    def _cached_raw_position(self, body: str, day: int, hour: float, compute) -> Tuple[int, int]:
+        """Look up or compute an unsmoothed position keyed by exact (body, day, hour)."""
+        cache_key = (body, day, hour)
+        if cache_key in self._raw_position_cache:
+            return self._raw_position_cache[cache_key]
+        
+        # Drop the oldest half when full; continuous playback rarely repeats a key
+        if len(self._raw_position_cache) >= self._max_raw_position_cache:
+            for key in list(self._raw_position_cache)[:self._max_raw_position_cache // 2]:
+                del self._raw_position_cache[key]
+        
+        position = compute(day, hour)
+        self._raw_position_cache[cache_key] = position
+        return position
+    
+    def _compute_raw_sun_position(self, day: int, hour: float) -> Tuple[int, int]:
+        """Uncached body of _calculate_raw_sun_position."""
         # Get actual sunrise/sunset data for current day
         if self.has_data:
-            day_data = self._get_cached_day_data(self.day_of_year)
-            if day_data and day_data.get('sunrise') is not None and day_data.get('sunset') is not None:
-                sunrise = day_data['sunrise']
-                sunset = day_data['sunset']
-                
+            day_data = self._get_cached_day_data(day)
+            sunrise, sunset = (day_data['sunrise'], day_data['sunset']) if day_data else (None, None)
+            if sunrise is not None and sunset is not None:
                 # Use actual astronomical data for sun position
                 if hour < sunrise:
                     day_progress = 0  # Before sunrise
@@ -670,26 +759,38 @@ class SkyAnimationEngine:
         # Apply smoothing
         return self._smooth_position(raw_pos, self.moon_pos_history)
     
-    def _calculate_raw_moon_position(self) -> Tuple[int, int]:
-        """Calculate raw moon position using cached astronomical data."""
+    def _calculate_raw_moon_position(self, day: Optional[int] = None, hour: Optional[float] = None) -> Tuple[int, int]:
+        """Calculate raw moon position using cached astronomical data.
+        
+        Day and hour default to the current animation state; passing them lets
+        sweeps evaluate many times without mutating the engine.
+        """
+        day = self.day_of_year if day is None else day
+        hour = self.animation_time if hour is None else hour
+        
+        return self._cached_raw_position('moon', day, hour, self._compute_raw_moon_position)
+    
+    def _compute_raw_moon_position(self, day: int, current_hour: float) -> Tuple[int, int]:
+        """Uncached body of _calculate_raw_moon_position."""
         if not self.has_data:
-            print(f"DEBUG: Using fallback moon position (no data) at {self.animation_time:.2f}h")
-            return self._get_fallback_moon_position()
+            print(f"DEBUG: Using fallback moon position (no data) at {current_hour:.2f}h")
+            return self._get_fallback_moon_position(day, current_hour)
         
         try:
-            # Use cached astronomical data
-            day_data = self._get_cached_day_data(self.day_of_year)
-            current_hour = self.animation_time
+            # Use cached astronomical data, unpacked once into locals
+            day_data = self._get_cached_day_data(day)
+            prev_day_data = self._get_cached_day_data(day - 1) if day > 1 else None
+            moonrise, moonset = (day_data['moonrise'], day_data['moonset']) if day_data else (None, None)
+            prev_moonrise, prev_moonset = (
+                (prev_day_data['moonrise'], prev_day_data['moonset']) if prev_day_data else (None, None)
+            )
             
             # First check if we should use previous day's cross-day moon
-            prev_day_data = self._get_cached_day_data(self.day_of_year - 1) if self.day_of_year > 1 else None
-            if (prev_day_data and 
-                prev_day_data.get('moonrise') is not None and 
-                prev_day_data.get('moonset') is not None and
-                prev_day_data['moonrise'] > prev_day_data['moonset']):
-                # Previous day had cross-day moon that should continue to today
-                prev_moonrise = prev_day_data['moonrise']
-                prev_moonset = prev_day_data['moonset']  # This is the moonset time for today
+            if (prev_moonrise is not None and 
+                prev_moonset is not None and
+                prev_moonrise > prev_moonset):
+                # Previous day had cross-day moon that should continue to today;
+                # prev_moonset is the moonset time for today
                 
                 # Moon should be visible from 00:00 until the moonset time
                 if current_hour <= prev_moonset:
@@ -700,30 +801,22 @@ class SkyAnimationEngine:
                     
                     return self._calculate_moon_arc_position(progress)
             
-            if day_data and day_data.get('moonrise') is not None and day_data.get('moonset') is not None:
+            if day_data and moonrise is not None and moonset is not None:
                 # Case: both moonrise and moonset exist for current day
-                moonrise = day_data['moonrise']
-                moonset = day_data['moonset']
-                
                 # Check if moon is currently visible with improved logic
-                is_visible, progress = self._calculate_moon_visibility(current_hour, moonrise, moonset)
+                is_visible, progress = self.moon_visibility_at(day, current_hour)
                 
                 if is_visible and progress is not None:
                     return self._calculate_moon_arc_position(progress)
                 else:
                     return (-100, -100)  # Off-screen position
                     
-            elif day_data and day_data.get('moonrise') is None and day_data.get('moonset') is not None:
+            elif day_data and moonrise is None and moonset is not None:
                 # Cross-day case: no moonrise today but moonset exists (moon rose yesterday)
-                moonset = day_data['moonset']
-                current_hour = self.animation_time
-                
                 # Moon is visible from start of day until moonset
                 if current_hour <= moonset:
-                    # Need to get previous day's moonrise to calculate total duration
-                    prev_day_data = self._get_cached_day_data(self.day_of_year - 1)
-                    if prev_day_data and prev_day_data.get('moonrise') is not None:
-                        prev_moonrise = prev_day_data['moonrise']
+                    # Need previous day's moonrise to calculate total duration
+                    if prev_moonrise is not None:
                         # Total duration spans from previous day's moonrise to today's moonset
                         total_duration = (24.0 - prev_moonrise) + moonset
                         # Time elapsed since moonrise (including previous day)
@@ -737,37 +830,47 @@ class SkyAnimationEngine:
                 else:
                     return (-100, -100)  # Off-screen position
             else:
-                print(f"DEBUG: Invalid day data for day {self.day_of_year}, using fallback")
+                print(f"DEBUG: Invalid day data for day {day}, using fallback")
             
         except Exception as e:
             print(f"Moon position calculation error: {e}")
             print(f"DEBUG: Exception in moon calculation, using fallback")
         
-        return self._get_fallback_moon_position()
+        return self._get_fallback_moon_position(day, current_hour)
     
     def _calculate_moon_visibility(self, current_hour: float, moonrise: float, moonset: float) -> Tuple[bool, Optional[float]]:
         """Determine if moon is visible and calculate its progress along arc."""
-        if moonrise < moonset:
-            # Normal case: moon rises then sets within same day
-            if moonrise <= current_hour <= moonset:
-                moon_duration = moonset - moonrise
-                progress = (current_hour - moonrise) / moon_duration if moon_duration > 0 else 0
-                return True, progress
-            else:
-                return False, None
-        else:
-            # Cross-day case: moonrise > moonset means moonset is NEXT day
-            # Total moon duration spans from moonrise on current day to moonset on next day
-            total_duration = (24.0 - moonrise) + moonset  # e.g., (24-23.283) + 11.233 = 12.05 hours
-            
-            if current_hour >= moonrise:
-                # Current day: after moonrise until end of day
-                time_since_rise = current_hour - moonrise
-                progress = time_since_rise / total_duration if total_duration > 0 else 0
-                return True, progress
-            else:
-                # Current day: before moonrise - not visible
-                return False, None
+        # Only the part after today's moonrise belongs to this day; the early
+        # morning of a cross-day moon comes from the previous day's data
+        is_visible, progress = moon_visibility(current_hour, moonrise, moonset)
+        if is_visible:
+            return True, progress
+        return False, None
+    
+    def moon_visibility_at(self, day: int, hour: float) -> Tuple[bool, float]:
+        """Moon (visible, progress) for a day with both moonrise and moonset.
+        
+        Whole-minute hours are read from the per-day tables; any other hour is
+        computed exactly, so results never depend on the table resolution.
+        """
+        minute = int(hour * 60)
+        if 0 <= minute < MINUTES_PER_DAY and MINUTE_HOURS[minute] == hour:
+            return bool(self._moon_vis_mask[day, minute]), float(self._moon_vis_prog[day, minute])
+        return self._day_visibility(day, self._moonrise[day], self._moonset[day])(hour)
+    
+    def _day_visibility(self, day: int, moonrise: float, moonset: float):
+        """Return the visibility function for a day, built once from its rise and set times."""
+        visibility = self._visibility_fn.get(day)
+        if visibility is None:
+            visibility = self._visibility_fn[day] = make_visibility(moonrise, moonset)
+        return visibility
+    
+    def _calculate_moon_visibility_vec(self, hours, moonrise, moonset) -> Tuple[np.ndarray, np.ndarray]:
+        """Vectorized _calculate_moon_visibility; hours, moonrise and moonset broadcast together.
+        
+        Returns (visible, progress) arrays; progress is NaN where the moon is not visible.
+        """
+        return moon_visibility_vec(hours, moonrise, moonset)
     
     def _calculate_moon_arc_position(self, progress: float) -> Tuple[int, int]:
         """Calculate moon position along its arc given progress (0.0 to 1.0)."""
@@ -784,9 +887,11 @@ class SkyAnimationEngine:
         
         return int(moon_x), int(moon_y)
     
-    def _get_fallback_moon_position(self) -> Tuple[int, int]:
+    def _get_fallback_moon_position(self, day: Optional[int] = None, hour: Optional[float] = None) -> Tuple[int, int]:
         """Fallback moon position calculation when no data available."""
-        print(f"DEBUG: Using fallback moon logic at {self.animation_time:.2f}h on day {self.day_of_year}")
+        day = self.day_of_year if day is None else day
+        current_hour = self.animation_time if hour is None else hour
+        print(f"DEBUG: Using fallback moon logic at {current_hour:.2f}h on day {day}")
         
         # Try to use approximate moonrise/moonset times even in fallback mode
         # Most moons rise in evening/night and set in morning
@@ -794,7 +899,6 @@ class SkyAnimationEngine:
         approximate_moonset = 8.0    # 8 AM average
         
         # Check if moon should be visible using approximate times
-        current_hour = self.animation_time
         
         # Moon is visible from moonrise to moonset (crossing midnight)
         if current_hour >= approximate_moonrise or current_hour <= approximate_moonset:
@@ -836,9 +940,8 @@ class SkyAnimationEngine:
         # Get actual sunrise/sunset times from data instead of hardcoded values
         if self.has_data:
             day_data = self._get_cached_day_data(self.day_of_year)
-            if day_data and day_data.get('sunrise') is not None and day_data.get('sunset') is not None:
-                sunrise = day_data['sunrise']
-                sunset = day_data['sunset']
+            sunrise, sunset = (day_data['sunrise'], day_data['sunset']) if day_data else (None, None)
+            if sunrise is not None and sunset is not None:
                 is_day = sunrise <= self.animation_time <= sunset
             else:
                 # Fallback to default times if no data
@@ -1,7 +1,7 @@
 import pandas as pd
-import numpy as np
 from PIL import Image, ImageDraw
 import os
+import sys
 
 # Configurable parameters
 IMG_WIDTH = 24  # hours in a day
@@ -13,26 +13,26 @@ MOON_COLOR = (180, 180, 255)    # Moon pixel overlay
 # Get the project root directory
 project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 data_dir = os.path.join(project_root, 'data')
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from src.core.time_utils import times_to_hours, nan_to_none
 
 # Load cleaned sun and moon data
-sun_df = pd.read_csv(os.path.join(data_dir, 'hongkong_sunrise_sunset_2024_clean.csv'))
-moon_df = pd.read_csv(os.path.join(data_dir, 'moonrise_moonset_2024_clean.csv'))
+sun_df = pd.read_csv(os.path.join(data_dir, 'hongkong_sunrise_sunset_2024_clean.csv'), usecols=['RISE', 'SET'], dtype=str)
+moon_df = pd.read_csv(os.path.join(data_dir, 'moonrise_moonset_2024_clean.csv'), usecols=['RISE', 'SET'], dtype=str)
 
-# Helper to convert HH:MM to hour as float
-def time_to_hour(t):
-    if pd.isna(t) or t == '':
-        return None
-    h, m = map(int, str(t).split(':'))
-    return h + m / 60.0
+# Every rise/set time parsed up front, None where missing
+sunrises, sunsets, moonrises, moonsets = (
+    [nan_to_none(h) for h in times_to_hours(column)]
+    for column in (sun_df['RISE'], sun_df['SET'], moon_df['RISE'], moon_df['SET'])
+)
 
 # Visualization logic
 pixels = []
-for idx, row in sun_df.iterrows():
-    sunrise = time_to_hour(row['RISE'])
-    sunset = time_to_hour(row['SET'])
-    moon_row = moon_df.iloc[idx]
-    moonrise = time_to_hour(moon_row['RISE'])
-    moonset = time_to_hour(moon_row['SET'])
+for idx in range(len(sun_df)):
+    sunrise, sunset = sunrises[idx], sunsets[idx]
+    moonrise, moonset = moonrises[idx], moonsets[idx]
     day_pixels = []
     for hour in range(24):
         color = NIGHT_COLOR
@@ -48,14 +48,13 @@ for idx, row in sun_df.iterrows():
                 moon_up = hour >= moonrise or hour < moonset
         if moon_up:
             # Overlay moon color (simple blend)
-            color = tuple(np.mean([color, MOON_COLOR], axis=0).astype(int))
+            color = ((color[0] + MOON_COLOR[0]) >> 1, (color[1] + MOON_COLOR[1]) >> 1, (color[2] + MOON_COLOR[2]) >> 1)
         day_pixels.append(color)
     pixels.append(day_pixels)
 
 # Create pixel art image
 img_height = len(pixels)
-img = Image.new('RGB', (IMG_WIDTH, img_height))
-pixels_flat = [px for row in pixels for px in row]
-img.putdata(pixels_flat)
+pixel_bytes = bytes(channel for row in pixels for px in row for channel in px)
+img = Image.frombytes('RGB', (IMG_WIDTH, img_height), pixel_bytes)
 img.save('sun_moon_pixelart_2024.png')
 print('Visualization saved as sun_moon_pixelart_2024.png')